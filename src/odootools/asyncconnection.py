@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+asyncio client to a distant Odoo server, mirroring odooconnection.Connection
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import asyncio
+import logging
+import ssl
+import xmlrpc.client as xmlrpclib
+from urllib.parse import urlsplit
+
+from .odooconnection import get_default_fields, get_odoo_url
+
+# *****************************
+# CONSTANTS
+
+DEFAULT_CONCURRENCY = 10
+
+
+# *****************************
+class AsyncXmlRpcClient:
+    """
+    Minimal HTTP/1.1 client sending xmlrpc requests over asyncio streams,
+    idle connections are kept alive and reused
+    """
+
+    def __init__(self, url, timeout=None):
+        parts = urlsplit(url)
+        self.url = url
+        self.host = parts.hostname
+        self.secure = parts.scheme == "https"
+        self.port = parts.port or (443 if self.secure else 80)
+        self.timeout = timeout
+        self._idle = []
+
+    # *************************************************************
+    async def call(self, endpoint, method, *params):
+        """
+        Calls method on /endpoint, Fault are raised as with a ServerProxy
+        """
+        body = xmlrpclib.dumps(params, method, allow_none=True).encode()
+        data = await asyncio.wait_for(self._request(endpoint, body), self.timeout)
+        return xmlrpclib.loads(data)[0][0]
+
+    # *************************************************************
+    async def close(self):
+        """
+        Closes idle connections
+        """
+        while self._idle:
+            _reader, writer = self._idle.pop()
+            writer.close()
+
+    # *************************************************************
+    async def _request(self, endpoint, body):
+        """
+        Posts body, re-sending it once if a reused connection was closed
+        """
+        head = (
+            "POST /{} HTTP/1.1\r\n"
+            "Host: {}:{}\r\n"
+            "User-Agent: odootools\r\n"
+            "Content-Type: text/xml\r\n"
+            "Content-Length: {}\r\n\r\n".format(
+                endpoint, self.host, self.port, len(body)
+            )
+        ).encode("latin-1")
+
+        while True:
+            reused = bool(self._idle)
+            if reused:
+                reader, writer = self._idle.pop()
+            else:
+                reader, writer = await asyncio.open_connection(
+                    self.host,
+                    self.port,
+                    ssl=ssl.create_default_context() if self.secure else None,
+                )
+            try:
+                writer.write(head + body)
+                await writer.drain()
+                status, reason, headers, data, keep_alive = await self._read_response(
+                    reader
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            if status != 200:
+                raise xmlrpclib.ProtocolError(
+                    self.url + "/" + endpoint, status, reason, headers
+                )
+            return data
+
+    # *************************************************************
+    @staticmethod
+    async def _read_response(reader):
+        """
+        Reads status, headers and body of a response
+        """
+        line = await reader.readline()
+        if not line:
+            raise ConnectionResetError("Connection closed by server")
+        version, status, reason = (line.decode("latin-1").rstrip("\r\n") + " ").split(
+            " ", 2
+        )
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, value = line.decode("latin-1").split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close" and (
+            version == "HTTP/1.1"
+            or headers.get("connection", "").lower() == "keep-alive"
+        )
+        if "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return int(status), reason.strip(), headers, data, keep_alive
+
+
+# *****************************
+class AsyncConnection:
+    """
+    asyncio counterpart of odooconnection.Connection, calls are run
+    concurrently on the event loop, at most odoo_concurrency (config value)
+    at a time
+    """
+
+    # *************************************************************
+    def __init__(self, ctx, concurrency=None):
+        self.context = ctx
+        self.odoo_context = None
+        self.xmlrpc_uid = None
+        self.object_endpoint = None
+        self.client = None
+        self.srv_ver = None
+        self.concurrency = concurrency
+        self.semaphore = None
+        self._connect_lock = None
+
+        if ctx is not None:
+            self.logger = ctx.logger
+            if concurrency is None:
+                self.concurrency = ctx.get_config_value(
+                    "odoo_concurrency", default=DEFAULT_CONCURRENCY, datatype="int"
+                )
+        else:
+            self.logger = logging.getLogger(__name__)
+
+    # *************************************************************
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # *************************************************************
+    async def connect(self):
+        """
+        authenticates against the Odoo server, returns uid; coroutines
+        calling it concurrently wait for a single authentication
+        """
+        if self.xmlrpc_uid is not None:
+            return self.xmlrpc_uid
+        # created on first use, so that it belongs to the running event loop
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self.xmlrpc_uid is None:
+                await self._authenticate()
+        return self.xmlrpc_uid
+
+    # *************************************************************
+    async def _authenticate(self):
+        """
+        server_version & authenticate calls, sets xmlrpc_uid on success
+        """
+        url = get_odoo_url(self.context)
+        if url is None:
+            self.logger.error("no connection information provided")
+            return
+
+        if self.client is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+            self.client = AsyncXmlRpcClient(
+                url,
+                timeout=self.context.get_config_value("odoo_timeout", datatype="float"),
+            )
+        try:
+            self.srv_ver = float(
+                (await self.client.call("xmlrpc/db", "server_version")).split("-")[0]
+            )
+        except (ConnectionRefusedError, asyncio.TimeoutError):
+            self.logger.error("Cannot Connect to Odoo Server")
+            return
+        self.logger.info(" Connected to odoo server version %s", str(self.srv_ver))
+
+        common = "xmlrpc/2/common" if self.srv_ver > 8.0 else "xmlrpc/common"
+        self.object_endpoint = (
+            "xmlrpc/2/object" if self.srv_ver > 8.0 else "xmlrpc/object"
+        )
+
+        lang = self.context.get_config_value("language")
+        self.odoo_context = {"lang": lang if lang is not None else "fr_FR"}
+
+        try:
+            uid = await self.client.call(
+                common,
+                "authenticate",
+                self.context.get_config_value("db_name"),
+                self.context.get_config_value("odoo_username"),
+                self.context.get_config_value("odoo_password"),
+                self.odoo_context,
+            )
+        except xmlrpclib.Fault as err:
+            self.logger.error(
+                "Cannot get authenticated against Odoo server! %s", str(err)
+            )
+            return
+
+        if not uid:
+            self.logger.error(
+                "ERROR: Not able to connect to Odoo with given information"
+                ", username: %s",
+                self.context.get_config_value("odoo_username"),
+            )
+            return
+
+        self.xmlrpc_uid = uid
+
+    # *************************************************************
+    async def close(self):
+        """
+        closes connections kept alive to the Odoo server
+        """
+        if self.client is not None:
+            await self.client.close()
+
+    # *************************************************************
+    async def execute_kw(self, model_name, method_name, args, kwargs=None):
+        """
+        Sends an execute_kw call once a concurrency slot is available, with
+        the language context unless kwargs has one, errors are raised
+        """
+        if self.xmlrpc_uid is None:
+            await self.connect()
+        if self.xmlrpc_uid is None:
+            raise ConnectionError("Not Connected to Odoo Database/Server")
+        call_kwargs = dict(kwargs or {})
+        call_kwargs.setdefault("context", self.odoo_context)
+        async with self.semaphore:
+            return await self.client.call(
+                self.object_endpoint,
+                "execute_kw",
+                self.context.get_config_value("db_name"),
+                self.xmlrpc_uid,
+                self.context.get_config_value("odoo_password"),
+                model_name,
+                method_name,
+                args,
+                call_kwargs,
+            )
+
+    # *************************************************************
+    def _log_fault(self, action, model_name, detail, err):
+        self.logger.error(
+            "     WARNING: error when %s object: %s -> %s",
+            action,
+            model_name,
+            str(detail),
+        )
+        self.logger.error(
+            "                    MSG: %s -> %s",
+            err.faultCode,
+            "".join(err.faultString.split("\n")[-2:]),
+        )
+
+    # *************************************************************
+    async def odoo_search(
+        self, model_name, search_conditions, result_parameters=None, fields=None
+    ):
+        """
+        Search elements in odoo, reading only fields if given (by default,
+        fields configured for the model)
+        """
+        if fields is None:
+            fields = get_default_fields(self.context, model_name)
+        try:
+            if self.xmlrpc_uid is None:
+                await self.connect()
+            if self.srv_ver is not None and self.srv_ver > 8.0:
+                result_parameters = dict(result_parameters or {})
+                if fields and "fields" not in result_parameters:
+                    result_parameters["fields"] = list(fields)
+                return await self.execute_kw(
+                    model_name, "search_read", [search_conditions], result_parameters
+                )
+            found = await self.execute_kw(model_name, "search", [search_conditions])
+            if found:
+                return await self.execute_kw(
+                    model_name, "read", [found] + ([list(fields)] if fields else [])
+                )
+            return ()
+        except xmlrpclib.Fault:
+            self.logger.exception(
+                "WARNING: error when searching for object: %s -> %s",
+                model_name,
+                str(search_conditions),
+            )
+            return ()
+
+    # *************************************************************
+    async def odoo_read(self, model_name, ids, fields=None):
+        """
+        Read elements in odoo, only fields if given (by default,
+        fields configured for the model)
+        """
+        if fields is None:
+            fields = get_default_fields(self.context, model_name)
+        try:
+            return await self.execute_kw(
+                model_name, "read", [ids] + ([list(fields)] if fields else [])
+            )
+        except xmlrpclib.Fault as err:
+            self._log_fault("reading", model_name, ids, err)
+            return None
+
+    # *************************************************************
+    async def odoo_write(self, model_name, obj_id, values):
+        """
+        Update element in odoo   // Single Object
+        """
+        try:
+            return await self.execute_kw(model_name, "write", [obj_id, values])
+        except xmlrpclib.Fault as err:
+            self._log_fault("writing", model_name, values, err)
+            return None
+
+    # *************************************************************
+    async def odoo_create(self, model_name, *values):
+        """
+        Create a new record
+        """
+        try:
+            return await self.execute_kw(model_name, "create", [values])
+        except xmlrpclib.Fault as err:
+            self._log_fault("creating", model_name, values, err)
+            return None
+
+    # *************************************************************
+    async def odoo_delete(self, model_name, obj_ids):
+        """
+        Deletes elements in odoo
+        """
+        if isinstance(obj_ids, int):
+            obj_ids = [obj_ids]
+        elif not isinstance(obj_ids, (tuple, list)):
+            return False
+        try:
+            return await self.execute_kw(model_name, "unlink", [obj_ids])
+        except xmlrpclib.Fault as err:
+            self._log_fault("deleting", model_name, obj_ids, err)
+            return None
+
+    # *************************************************************
+    async def odoo_execute(self, model_name, method_name, obj_ids, parameters):
+        """
+        Run execute_kw
+        """
+        if isinstance(obj_ids, int):
+            obj_ids = [obj_ids]
+        elif not isinstance(obj_ids, (tuple, list)):
+            return False
+        try:
+            return await self.execute_kw(model_name, method_name, [obj_ids, parameters])
+        except xmlrpclib.Fault as err:
+            self._log_fault(
+                "executing {} on".format(method_name), model_name, parameters, err
+            )
+            return None
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Client-side caches for data read from Odoo
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 600.0
+
+
+# -------------------------------------------------------------------------------------
+def freeze(value):
+    """
+    Hashable (and normalised) version of a domain, list of ids, kwargs...
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    if isinstance(value, set):
+        return tuple(sorted(freeze(val) for val in value))
+    return value
+
+
+# -------------------------------------------------------------------------------------
+class LRUCache:
+    """
+    Thread-safe cache holding at most max_size entries for ttl seconds,
+    least recently used entries are evicted first
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        returns (True, value) if key is cached, (False, None) otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl is None or time.monotonic() - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """
+        caches value, evicting the least recently used entry if full
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        drops every entry
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        hits, misses and current size
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
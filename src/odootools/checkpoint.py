@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Checkpoints of long running scripts, saved in a SQLite file so that a
+script run again after a failure can skip the work already done
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import sqlite3
+from itertools import islice
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+# number of keys looked up / inserted per SQL statement
+DEFAULT_KEYS_BATCH = 500
+
+
+# -------------------------------------------------------------------------------------
+class CheckpointStore:
+    """
+    Progress of a script, saved in a SQLite file:
+
+    - processed keys (stored as strings): millions of them can be recorded
+      and checked by batches, they are never all loaded in memory
+    - watermarks: named values, e.g. the last id processed
+
+    Entries of different namespaces (e.g. script runs with different
+    configs, see AbstractOdooScript.get_checkpoint_store) are independent.
+
+        with script.get_checkpoint_store() as store:
+            for keys in batches:
+                todo = list(store.filter_new(keys))
+                ...
+                store.mark_done(todo)
+    """
+
+    def __init__(self, filename, namespace=""):
+        self.filename = filename
+        self.namespace = namespace
+        self.db = sqlite3.connect(filename)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS processed_keys ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+            )
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "namespace TEXT NOT NULL, name TEXT NOT NULL, value, "
+                "PRIMARY KEY (namespace, name))"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, key):
+        return self.is_done(key)
+
+    # *************************************************************
+    def close(self):
+        """
+        Closes the SQLite file
+        """
+        self.db.close()
+
+    # *************************************************************
+    def is_done(self, key):
+        """
+        Whether key has been recorded as processed
+        """
+        cursor = self.db.execute(
+            "SELECT 1 FROM processed_keys WHERE namespace = ? AND key = ?",
+            (self.namespace, str(key)),
+        )
+        return cursor.fetchone() is not None
+
+    # *************************************************************
+    def mark_done(self, keys):
+        """
+        Records keys (an iterable) as processed, returns their number
+        """
+        count = 0
+        keys = iter(keys)
+        with self.db:
+            while True:
+                batch = [
+                    (self.namespace, str(key))
+                    for key in islice(keys, DEFAULT_KEYS_BATCH)
+                ]
+                if not batch:
+                    break
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO processed_keys (namespace, key) "
+                    "VALUES (?, ?)",
+                    batch,
+                )
+                count += len(batch)
+        return count
+
+    # *************************************************************
+    def filter_new(self, keys):
+        """
+        Generator yielding the keys (an iterable) not processed yet
+        """
+        keys = iter(keys)
+        while True:
+            batch = list(islice(keys, DEFAULT_KEYS_BATCH))
+            if not batch:
+                return
+            done = {
+                row[0]
+                for row in self.db.execute(
+                    "SELECT key FROM processed_keys WHERE namespace = ? "
+                    "AND key IN ({})".format(", ".join("?" * len(batch))),
+                    [self.namespace] + [str(key) for key in batch],
+                )
+            }
+            for key in batch:
+                if str(key) not in done:
+                    yield key
+
+    # *************************************************************
+    def count(self):
+        """
+        Number of processed keys
+        """
+        cursor = self.db.execute(
+            "SELECT count(*) FROM processed_keys WHERE namespace = ?",
+            (self.namespace,),
+        )
+        return cursor.fetchone()[0]
+
+    # *************************************************************
+    def get_watermark(self, name, default=None):
+        """
+        Value of watermark name, default if not set
+        """
+        row = self.db.execute(
+            "SELECT value FROM watermarks WHERE namespace = ? AND name = ?",
+            (self.namespace, name),
+        ).fetchone()
+        return default if row is None else row[0]
+
+    # *************************************************************
+    def set_watermark(self, name, value):
+        """
+        Saves value (int, float, str...) as watermark name, None removes it
+        """
+        with self.db:
+            if value is None:
+                self.db.execute(
+                    "DELETE FROM watermarks WHERE namespace = ? AND name = ?",
+                    (self.namespace, name),
+                )
+            else:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO watermarks (namespace, name, value) "
+                    "VALUES (?, ?, ?)",
+                    (self.namespace, name, value),
+                )
+
+    # *************************************************************
+    def clear(self):
+        """
+        Forgets processed keys & watermarks of the namespace
+        """
+        with self.db:
+            self.db.execute(
+                "DELETE FROM processed_keys WHERE namespace = ?", (self.namespace,)
+            )
+            self.db.execute(
+                "DELETE FROM watermarks WHERE namespace = ?", (self.namespace,)
+            )
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Column-level versions of stringconverters to_date, to_float & to_int, for
+large tabular imports: each distinct value is converted once (memoised),
+results come back as typed arrays with a null mask.
+
+NumPy arrays are used when NumPy is installed and asked for (or given as
+input), stdlib arrays otherwise.
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import math
+import re
+from array import array
+from collections import namedtuple
+from datetime import date, datetime
+
+from .stringconverters import XLS_DATE_REF
+
+try:
+    import numpy
+
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+XLS_DATE_ORDINAL = XLS_DATE_REF.toordinal()
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+MAX_ORDINAL = date.max.toordinal()
+NULL_INT = -1
+# bounds of int64 arrays, ints out of them are nulls
+MIN_INT = -(2**63)
+MAX_INT = 2**63 - 1
+
+# formats accepted by stringconverters.to_date
+_DMY_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})$")
+_YMD_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}) 00:00:00$")
+
+# values: converted values, nulls: True where the value could not be converted
+ConvertedColumn = namedtuple("ConvertedColumn", ("values", "nulls"))
+
+
+# -------------------------------------------------------------------------------------
+def _parse_float(value):
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_int(value):
+    if value is None or value == "":
+        return None
+    try:
+        result = int(value)
+    except (TypeError, ValueError):
+        try:
+            result = int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return None
+    return result if MIN_INT <= result <= MAX_INT else None
+
+
+def _parse_ordinal(value):
+    """
+    proleptic Gregorian ordinal of a date value, None if not a date
+    """
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    serial = _parse_float(value)
+    if serial is not None:
+        if math.isnan(serial) or math.isinf(serial):
+            return None
+        ordinal = XLS_DATE_ORDINAL + math.floor(serial)
+        return ordinal if 0 < ordinal <= MAX_ORDINAL else None
+    if not isinstance(value, str):
+        return None
+    match = _DMY_RE.match(value)
+    if match:
+        day, month, year = match.groups()
+    else:
+        match = _YMD_RE.match(value)
+        if not match:
+            return None
+        year, month, day = match.groups()
+    try:
+        return date(int(year), int(month), int(day)).toordinal()
+    except ValueError:
+        return None
+
+
+# -------------------------------------------------------------------------------------
+def _memoised(values, parse, memo):
+    """
+    parse(value) for each value, each distinct value being parsed once
+    """
+    if memo is None:
+        memo = {}
+    results = []
+    append = results.append
+    for value in values:
+        try:
+            result = memo[value]
+        except KeyError:
+            result = memo[value] = parse(value)
+        except TypeError:
+            # unhashable value
+            result = parse(value)
+        append(result)
+    return results
+
+
+def _use_numpy(values, as_numpy):
+    if as_numpy is None:
+        return NUMPY and isinstance(values, numpy.ndarray)
+    if as_numpy and not NUMPY:
+        raise ImportError("NumPy is not installed")
+    return as_numpy
+
+
+def _numeric_array(values):
+    """
+    values as a float64 NumPy array if it is a numeric one, None otherwise
+    """
+    if isinstance(values, numpy.ndarray) and values.dtype.kind in "biuf":
+        return values.astype(numpy.float64)
+    return None
+
+
+# -------------------------------------------------------------------------------------
+def to_float_column(values, as_numpy=None, memo=None):
+    """
+    Column version of stringconverters.to_float: values converted to floats
+    (NaN for nulls) with their null mask.
+    memo is an optional dict of already converted values, shared between
+    calls (e.g. chunks of the same column)
+    """
+    if _use_numpy(values, as_numpy):
+        floats = _numeric_array(values)
+        if floats is None:
+            floats = numpy.array(
+                [
+                    math.nan if val is None else val
+                    for val in _memoised(values, _parse_float, memo)
+                ],
+                dtype=numpy.float64,
+            )
+        return ConvertedColumn(floats, numpy.isnan(floats))
+
+    converted = _memoised(values, _parse_float, memo)
+    return ConvertedColumn(
+        array("d", (math.nan if val is None else val for val in converted)),
+        [val is None or math.isnan(val) for val in converted],
+    )
+
+
+# -------------------------------------------------------------------------------------
+def to_int_column(values, as_numpy=None, memo=None):
+    """
+    Column version of stringconverters.to_int: values converted to ints
+    (-1 for nulls, as to_int) with their null mask, ints that do not fit
+    in 64 bits are nulls.
+    memo is an optional dict of already converted values, shared between
+    calls (e.g. chunks of the same column)
+    """
+    if _use_numpy(values, as_numpy):
+        floats = _numeric_array(values)
+        if floats is not None:
+            floats = numpy.trunc(floats)
+            # float(MAX_INT) rounds up to 2**63
+            nulls = ~((floats >= MIN_INT) & (floats < float(MAX_INT)))
+            ints = numpy.where(nulls, NULL_INT, floats)
+            return ConvertedColumn(ints.astype(numpy.int64), nulls)
+        converted = _memoised(values, _parse_int, memo)
+        nulls = numpy.fromiter(
+            (val is None for val in converted), dtype=bool, count=len(converted)
+        )
+        ints = numpy.fromiter(
+            (NULL_INT if val is None else val for val in converted),
+            dtype=numpy.int64,
+            count=len(converted),
+        )
+        return ConvertedColumn(ints, nulls)
+
+    converted = _memoised(values, _parse_int, memo)
+    return ConvertedColumn(
+        array("q", (NULL_INT if val is None else val for val in converted)),
+        [val is None for val in converted],
+    )
+
+
+# -------------------------------------------------------------------------------------
+def to_date_column(values, as_numpy=None, memo=None):
+    """
+    Column version of stringconverters.to_date: values converted to dates
+    with their null mask. Numbers are Excel serial dates (from XLS_DATE_REF),
+    strings are dd/mm/YYYY or YYYY-mm-dd 00:00:00 dates.
+    Dates are returned as a datetime64[D] NumPy array (NaT for nulls), or
+    as a list of date (None for nulls) without NumPy.
+    memo is an optional dict of already converted values, shared between
+    calls (e.g. chunks of the same column)
+    """
+    if _use_numpy(values, as_numpy):
+        serials = _numeric_array(values)
+        if serials is not None:
+            # Excel serial dates, converted arithmetically
+            ordinals = numpy.floor(serials) + XLS_DATE_ORDINAL
+            nulls = ~((ordinals > 0) & (ordinals <= MAX_ORDINAL))
+            days = numpy.where(nulls, EPOCH_ORDINAL, ordinals).astype(numpy.int64)
+            dates = (days - EPOCH_ORDINAL).astype("datetime64[D]")
+        else:
+            ordinals = _memoised(values, _parse_ordinal, memo)
+            nulls = numpy.fromiter(
+                (val is None for val in ordinals), dtype=bool, count=len(ordinals)
+            )
+            dates = (
+                numpy.fromiter(
+                    (EPOCH_ORDINAL if val is None else val for val in ordinals),
+                    dtype=numpy.int64,
+                    count=len(ordinals),
+                )
+                - EPOCH_ORDINAL
+            ).astype("datetime64[D]")
+        dates[nulls] = numpy.datetime64("NaT")
+        return ConvertedColumn(dates, nulls)
+
+    ordinals = _memoised(values, _parse_ordinal, memo)
+    return ConvertedColumn(
+        [None if val is None else date.fromordinal(val) for val in ordinals],
+        [val is None for val in ordinals],
+    )
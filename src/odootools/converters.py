@@ -13,16 +13,55 @@ Utility functions to convert data
 
 from datetime import date, datetime
 
-from odoo.tools import (
-    DEFAULT_SERVER_DATE_FORMAT,
-    DEFAULT_SERVER_DATETIME_FORMAT,
-)
-
-from .stringconverters import to_string
+from .stringconverters import resolve_converter, to_string
 
 # -------------------------------------------------------------------------------------
 # CONSTANTS
 XLS_DATE_REF = date(1900, 1, 1)
+# same as odoo.tools, not imported for odoo to be loaded only when needed
+DEFAULT_SERVER_DATE_FORMAT = "%Y-%m-%d"
+DEFAULT_SERVER_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+# -------------------------------------------------------------------------------------
+def _datetime_to_odoo_string(val):
+    return val.strftime(DEFAULT_SERVER_DATETIME_FORMAT)
+
+
+def _date_to_odoo_string(val):
+    return val.strftime(DEFAULT_SERVER_DATE_FORMAT)
+
+
+# type -> function(value) returning an Odoo compatible string,
+# see register_odoo_string
+ODOO_STRING_CONVERTERS = {
+    object: to_string,
+    date: _date_to_odoo_string,
+    datetime: _datetime_to_odoo_string,
+}
+_odoo_string_cache = {}
+
+
+# -------------------------------------------------------------------------------------
+def register_odoo_string(cls, converter=None):
+    """
+    Registers converter(value) as the date_to_odoo_string conversion of cls
+    (and its subclasses), can be used as a decorator
+    """
+    if converter is None:
+        return lambda func: register_odoo_string(cls, func)
+    ODOO_STRING_CONVERTERS[cls] = converter
+    _odoo_string_cache.clear()
+    return converter
+
+
+# -------------------------------------------------------------------------------------
+def unregister_odoo_string(cls):
+    """
+    Removes the date_to_odoo_string conversion registered for cls
+    """
+    ODOO_STRING_CONVERTERS.pop(cls, None)
+    _odoo_string_cache.clear()
 
 
 # -------------------------------------------------------------------------------------
@@ -30,8 +69,9 @@ def date_to_odoo_string(val):
     """ "
     Utility: translate date to an Odoo compatible string
     """
-    if isinstance(val, datetime):
-        return val.strftime(DEFAULT_SERVER_DATETIME_FORMAT)
-    if isinstance(val, date):
-        return val.strftime(DEFAULT_SERVER_DATE_FORMAT)
-    return to_string(val)
+    converter = _odoo_string_cache.get(type(val))
+    if converter is None:
+        converter = resolve_converter(
+            ODOO_STRING_CONVERTERS, _odoo_string_cache, type(val)
+        )
+    return converter(val)
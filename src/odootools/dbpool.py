@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Pool of connections to the PostgreSQL database of Odoo, with pluggable
+DB-API drivers (PyGreSQL pgdb, psycopg2...)
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+DEFAULT_DB_DRIVER = "pgdb"
+DEFAULT_DB_PORT = 5432
+DEFAULT_POOL_MAX_SIZE = 5
+# seconds acquire waits for a connection to be released
+DEFAULT_POOL_TIMEOUT = 30.0
+# idle connections are checked (SELECT 1) before reuse after that many seconds
+DEFAULT_CHECK_INTERVAL = 30.0
+
+
+# -------------------------------------------------------------------------------------
+def _connect_pgdb(database, host=None, port=None, user=None, password=None):
+    """
+    PyGreSQL DB-API connection
+    """
+    import pgdb  # pylint: disable=import-outside-toplevel
+
+    if host:
+        host = "{}:{}".format(host, port or DEFAULT_DB_PORT)
+    return pgdb.connect(database=database, host=host, user=user, password=password)
+
+
+# -------------------------------------------------------------------------------------
+def _connect_psycopg2(database, host=None, port=None, user=None, password=None):
+    """
+    psycopg2 DB-API connection
+    """
+    import psycopg2  # pylint: disable=import-outside-toplevel
+
+    params = {"dbname": database, "user": user, "password": password}
+    if host:
+        params.update({"host": host, "port": port or DEFAULT_DB_PORT})
+    return psycopg2.connect(
+        **{key: value for key, value in params.items() if value is not None}
+    )
+
+
+# driver name -> function(database, host, port, user, password) returning
+# a DB-API connection, see register_db_driver
+DB_DRIVERS = {"pgdb": _connect_pgdb, "psycopg2": _connect_psycopg2}
+
+
+# -------------------------------------------------------------------------------------
+def register_db_driver(name, connect):
+    """
+    Makes a DB-API driver available as db_driver = name, connect is called
+    with database, host, port, user and password keyword arguments
+    """
+    DB_DRIVERS[name] = connect
+
+
+# -------------------------------------------------------------------------------------
+def _release_unclosed(pool, raw_connection):
+    """
+    gives back the connection of a PooledDbConnection garbage collected
+    without being closed
+    """
+    pool.logger.warning("Database connection not closed, given back to its pool")
+    pool.release(raw_connection)
+
+
+# -------------------------------------------------------------------------------------
+class PooledDbConnection:
+    """
+    DB-API connection borrowed from a DbConnectionPool, close() gives it
+    back to the pool instead of closing it (as does garbage collection of
+    an unclosed one)
+    """
+
+    def __init__(self, pool, raw_connection):
+        self.pool = pool
+        self.raw_connection = raw_connection
+        self._finalizer = weakref.finalize(
+            self, _release_unclosed, pool, raw_connection
+        )
+        self._finalizer.atexit = False
+
+    def __getattr__(self, name):
+        if self.raw_connection is None:
+            raise AttributeError("Connection already given back to its pool")
+        return getattr(self.raw_connection, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        gives the connection back to the pool
+        """
+        if self.raw_connection is not None:
+            self._finalizer.detach()
+            self.pool.release(self.raw_connection)
+            self.raw_connection = None
+
+
+# -------------------------------------------------------------------------------------
+class DbConnectionPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe pool of DB-API connections:
+
+    - at most max_size connections are open, acquire waits (up to timeout
+      seconds, None to wait forever) for one to be released when all are
+      in use
+    - min_size connections are opened upfront and kept when idle
+    - idle connections are checked with a "SELECT 1" before reuse when
+      unused for more than check_interval seconds, closed when unused for
+      more than max_idle seconds (None to keep them)
+    - released connections are rolled back, broken ones are discarded
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        connect,
+        min_size=0,
+        max_size=DEFAULT_POOL_MAX_SIZE,
+        check_interval=DEFAULT_CHECK_INTERVAL,
+        max_idle=None,
+        timeout=DEFAULT_POOL_TIMEOUT,
+    ):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.check_interval = check_interval
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        self.opened = 0
+        self.reused = 0
+        self._size = 0
+        self._idle = []  # (connection, last release time), most recent last
+        self._filled = False
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls, context):
+        """
+        Builds the pool from config values:
+
+            db_name, db_host, db_port, db_username, db_password, db_local
+            db_driver = pgdb | psycopg2 | any registered driver
+            db_pool_min, db_pool_max, db_pool_timeout
+        """
+        driver = context.get_config_value("db_driver", default=DEFAULT_DB_DRIVER)
+        if driver not in DB_DRIVERS:
+            raise ValueError("Unknown db_driver {}".format(driver))
+        params = {
+            "database": context.get_config_value("db_name"),
+            "user": context.get_config_value("db_username"),
+            "password": context.get_config_value("db_password"),
+        }
+        if context.get_config_value("db_local") != "1":
+            params["host"] = context.get_config_value("db_host")
+            params["port"] = context.get_config_value(
+                "db_port", default=DEFAULT_DB_PORT, datatype="int"
+            )
+
+        def connect():
+            return DB_DRIVERS[driver](**params)
+
+        return cls(
+            connect,
+            min_size=context.get_config_value("db_pool_min", default=0, datatype="int"),
+            max_size=context.get_config_value(
+                "db_pool_max", default=DEFAULT_POOL_MAX_SIZE, datatype="int"
+            ),
+            timeout=context.get_config_value(
+                "db_pool_timeout", default=DEFAULT_POOL_TIMEOUT, datatype="float"
+            ),
+        )
+
+    # *************************************************************
+    def _open(self):
+        connection = self.connect()
+        self.opened += 1
+        return connection
+
+    @staticmethod
+    def _is_alive(connection):
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            connection.rollback()
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    @staticmethod
+    def _discard(connection):
+        try:
+            connection.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    def _fill(self):
+        while self._size < self.min_size:
+            self._idle.insert(0, (self._open(), time.monotonic()))
+            self._size += 1
+        self._filled = True
+
+    # *************************************************************
+    def acquire(self):
+        """
+        Returns an open connection, wrapped in a PooledDbConnection
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            connection = None
+            with self._cond:
+                if not self._filled:
+                    self._fill()
+                while not self._idle and self._size >= self.max_size:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            "No database connection available after {}s".format(
+                                self.timeout
+                            )
+                        )
+                    self._cond.wait(remaining)
+                if self._idle:
+                    connection, released = self._idle.pop()
+                else:
+                    self._size += 1
+
+            if connection is None:
+                # connect outside of the lock, it may be slow
+                try:
+                    return PooledDbConnection(self, self._open())
+                except BaseException:
+                    self._forget()
+                    raise
+
+            idle_time = time.monotonic() - released
+            if (
+                self.max_idle is not None
+                and idle_time > self.max_idle
+                and self._size > self.min_size
+            ) or (
+                self.check_interval is not None
+                and idle_time > self.check_interval
+                and not self._is_alive(connection)
+            ):
+                self._discard(connection)
+                self._forget()
+                continue
+            self.reused += 1
+            return PooledDbConnection(self, connection)
+
+    def _forget(self):
+        """
+        a connection of the pool has been closed
+        """
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    # *************************************************************
+    def release(self, connection):
+        """
+        Rolls back connection and makes it available again, it is closed
+        if broken
+        """
+        try:
+            connection.rollback()
+        except Exception:  # pylint: disable=broad-except
+            self.logger.warning("Discarding broken database connection")
+            self._discard(connection)
+            self._forget()
+            return
+        with self._cond:
+            self._idle.append((connection, time.monotonic()))
+            self._cond.notify()
+
+    # *************************************************************
+    @contextmanager
+    def connection(self):
+        """
+        Context manager borrowing a connection from the pool
+        """
+        db_conn = self.acquire()
+        try:
+            yield db_conn
+        finally:
+            db_conn.close()
+
+    # *************************************************************
+    def close(self):
+        """
+        Closes idle connections, connections in use go back to the pool
+        when released
+        """
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._filled = False
+        for connection, _released in idle:
+            self._discard(connection)
+
+    def stats(self):
+        """
+        opened, reused, current size and idle connections
+        """
+        with self._cond:
+            return {
+                "opened": self.opened,
+                "reused": self.reused,
+                "size": self._size,
+                "idle": len(self._idle),
+            }
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Statistics on calls made to a distant Odoo server
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import csv
+import json
+import threading
+import xmlrpc.client as xmlrpclib
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+# upper bounds (ms) of latency histogram buckets, last one is unbounded
+LATENCY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CSV_COLUMNS = (
+    "model",
+    "method",
+    "calls",
+    "faults",
+    "errors",
+    "total_s",
+    "avg_ms",
+    "p50_ms",
+    "p95_ms",
+    "max_ms",
+    "request_bytes",
+    "response_bytes",
+)
+
+
+# -------------------------------------------------------------------------------------
+class MethodStatistics:
+    """
+    Statistics of the calls to one (model, method)
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.faults = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, elapsed, request_size, response_size, error):
+        """
+        adds a call
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.request_bytes += request_size
+        self.response_bytes += response_size
+        if isinstance(error, xmlrpclib.Fault):
+            self.faults += 1
+        elif error is not None:
+            self.errors += 1
+        elapsed_ms = elapsed * 1000
+        for idx, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed_ms <= bound:
+                self.histogram[idx] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def percentile(self, ratio):
+        """
+        approximate latency (ms) percentile: upper bound of its bucket
+        """
+        rank = ratio * self.calls
+        seen = 0
+        for idx, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                if idx < len(LATENCY_BUCKETS):
+                    return float(LATENCY_BUCKETS[idx])
+                return self.max_time * 1000
+        return 0.0
+
+    def as_dict(self, model_name, method_name):
+        """
+        row of the summary
+        """
+        return {
+            "model": model_name,
+            "method": method_name,
+            "calls": self.calls,
+            "faults": self.faults,
+            "errors": self.errors,
+            "total_s": round(self.total_time, 3),
+            "avg_ms": round(self.total_time * 1000 / self.calls, 1),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_time * 1000, 1),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+# -------------------------------------------------------------------------------------
+class CallStatistics:
+    """
+    Default instrumentation of a Connection: counts, latency histogram,
+    payload sizes and faults per (model, method).
+
+    Any object with a record(model_name, method_name, elapsed, request_size,
+    response_size, error) method can be used as Connection.instrumentation
+    """
+
+    def __init__(self):
+        self.methods = {}
+        self._lock = threading.Lock()
+
+    def record(  # pylint: disable=too-many-arguments
+        self, model_name, method_name, elapsed, request_size, response_size, error
+    ):
+        """
+        records a call that took elapsed seconds, error is the exception
+        raised by the call if any
+        """
+        with self._lock:
+            stats = self.methods.get((model_name, method_name))
+            if stats is None:
+                stats = self.methods[(model_name, method_name)] = MethodStatistics()
+            stats.add(elapsed, request_size, response_size, error)
+
+    def rows(self):
+        """
+        summary rows, by decreasing total time
+        """
+        with self._lock:
+            rows = [
+                stats.as_dict(model_name, method_name)
+                for (model_name, method_name), stats in self.methods.items()
+            ]
+        return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+    def format_summary(self):
+        """
+        summary as a text table
+        """
+        lines = [
+            "{:<30} {:<16} {:>7} {:>6} {:>6} {:>9} {:>8} {:>8} {:>8} {:>8} "
+            "{:>10} {:>10}".format(*CSV_COLUMNS)
+        ]
+        for row in self.rows():
+            lines.append(
+                "{model:<30} {method:<16} {calls:>7} {faults:>6} {errors:>6} "
+                "{total_s:>9.3f} {avg_ms:>8.1f} {p50_ms:>8.1f} {p95_ms:>8.1f} "
+                "{max_ms:>8.1f} {request_bytes:>10} {response_bytes:>10}".format(**row)
+            )
+        return "\n".join(lines)
+
+    def export(self, filename):
+        """
+        writes the summary to a .json or .csv file
+        """
+        rows = self.rows()
+        with open(filename, "w", newline="") as afile:
+            if filename.endswith(".csv"):
+                writer = csv.DictWriter(afile, fieldnames=CSV_COLUMNS)
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, afile, indent=2)
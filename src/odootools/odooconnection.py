@@ -13,24 +13,36 @@ Utility functions to convert data
 
 import copy
 import logging
+import queue
+import socket
 import sys
+import threading
+import time
 import xmlrpc.client as xmlrpclib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 
+from .cache import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, LRUCache, freeze
+from .dbpool import DbConnectionPool
+from .instrumentation import CallStatistics
+from .pgbulk import (
+    DEFAULT_BATCH_SIZE,
+    StagingLoader,
+    copy_rows,
+    copy_to_csv,
+    iter_query,
+)
+from .retry import CircuitBreaker, RetryPolicy, classify_error
 from .stringconverters import to_string
-
-
-try:
-    import pgdb
-
-    PGDB = "connect" in dir(
-        pgdb
-    )  # may have confusion between PyGreSQL et pgdb modules :(
-except ImportError:
-    PGDB = False
-    logging.warning(
-        "error on import PGDB module => cannot connect locally to POSTGRESQL "
-    )
-
+from .transport import (
+    DEFAULT_MAX_IDLE,
+    PROTOCOL_JSONRPC,
+    PROTOCOL_XMLRPC,
+    get_keepalive_transport,
+    get_server_proxy,
+)
 
 # *****************************
 # CONSTANTS
@@ -42,6 +54,451 @@ ALL_INSTANCES_FILTER = (
 
 ODOO_DATE_FMT = "%Y-%m-%d %H:%M:%S"  # '2018-03-01 11:50:17'
 
+DOMAIN_OPERATORS_ARITY = {"!": 1, "&": 2, "|": 2}
+
+# methods whose results may be cached, any other call on a cached model
+# invalidates its cache
+CACHED_METHODS = (
+    "search",
+    "search_read",
+    "search_count",
+    "read",
+    "read_group",
+    "name_search",
+    "fields_get",
+)
+TRUE_LEAF = (1, "=", 1)
+
+# field types whose values read back can be compared client-side to a
+# ("field", "=", value) criteria, with the accepted types of value (False
+# is always accepted); many2one only with ids, a name would be searched
+CLIENT_MATCHED_TYPES = {
+    "char": (str,),
+    "selection": (str,),
+    "date": (str,),
+    "integer": (int,),
+    "float": (int, float),
+    "boolean": (bool,),
+    "many2one": (int,),
+}
+
+# outcomes of odoo_search_create_or_write_many, one per row
+UPSERT_CREATED = "created"
+UPSERT_UPDATED = "updated"
+UPSERT_FOUND = "found"
+UPSERT_AMBIGUOUS = "ambiguous"
+UPSERT_FAILED = "failed"
+
+UpsertResult = namedtuple("UpsertResult", ("status", "id", "error"))
+
+# calls queued in a Batch and sent together, key is None if the group is
+# not mergeable, ids are the records the calls apply to
+QueuedGroup = namedtuple("QueuedGroup", ("key", "call", "calls", "ids"))
+
+# methods returning the same result whatever the records, Batch merges
+# their calls by default
+MERGEABLE_METHODS = ("write", "unlink")
+
+
+# *****************************
+def normalize_domain(domain):
+    """
+    Returns domain as a single polish notation expression, making
+    implicit AND operators explicit (as odoo.osv.expression does)
+    """
+    if not domain:
+        return [TRUE_LEAF]
+    result = []
+    expected = 1
+    for token in domain:
+        if expected == 0:
+            result[0:0] = ["&"]
+            expected = 1
+        if isinstance(token, (list, tuple)):
+            expected -= 1
+        else:
+            expected += DOMAIN_OPERATORS_ARITY.get(token, 0) - 1
+        result.append(token)
+    return result
+
+
+# *****************************
+def or_domains(domains):
+    """
+    Combines several domains with OR operators
+    """
+    result = []
+    count = 0
+    for domain in domains:
+        result += normalize_domain(domain)
+        count += 1
+    if count == 0:
+        return []
+    return ["|"] * (count - 1) + result
+
+
+# *****************************
+def get_odoo_url(context):
+    """
+    Builds the url of the Odoo server from odoo_host & odoo_port config
+    values, None if not configured
+    """
+    odoo_host = context.get_config_value("odoo_host")
+    odoo_port = context.get_config_value("odoo_port")
+    if odoo_host is None or odoo_port is None:
+        return None
+    if odoo_port == "443":
+        return "https://" + odoo_host
+    return "http://" + odoo_host + ":" + odoo_port
+
+
+# *****************************
+def get_default_fields(context, model_name):
+    """
+    Fields read by default for a model, as configured in the [fields]
+    section of config, e.g.:
+
+        [fields]
+        res.partner = name,ref,email
+
+    None (all fields) if not configured
+    """
+    fields = context.get_config_value(model_name, section="fields")
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+# *****************************
+def chunked(iterable, size):
+    """
+    Splits iterable in lists of (at most) size elements
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+# *****************************
+def _compact_group(group, groupby, lazy):
+    """
+    Strips a read_group result of its __domain, __context..., many2one
+    group values are kept as ids, count is under __count
+    """
+    row = {}
+    for key, value in group.items():
+        if key.startswith("__"):
+            continue
+        if key in groupby and isinstance(value, (list, tuple)) and value:
+            value = value[0]
+        row[key] = value
+    if lazy:
+        row["__count"] = row.pop("{}_count".format(groupby[0].split(":")[0]), 0)
+    else:
+        row["__count"] = group.get("__count", 0)
+    return row
+
+
+# *****************************
+def _as_id_list(obj_ids):
+    """
+    ids given as a single int or a sequence, as a list
+    """
+    if isinstance(obj_ids, int):
+        return [obj_ids]
+    return list(obj_ids)
+
+
+# *****************************
+def _simple_criteria_key(search_criteria, field_types):
+    """
+    Returns a hashable key for criteria only made of ("field", "=", value)
+    leaves where value can be compared to the value read back (see
+    CLIENT_MATCHED_TYPES, field_types gives the type of each field), None
+    when criteria cannot be matched client-side
+    """
+    key = []
+    for leaf in search_criteria:
+        if not isinstance(leaf, (list, tuple)) or len(leaf) != 3:
+            return None
+        field, oper, value = leaf
+        if oper != "=":
+            return None
+        value_types = CLIENT_MATCHED_TYPES.get(field_types.get(field))
+        if value_types is None:
+            return None
+        if value is not False and (
+            not isinstance(value, value_types)
+            or (isinstance(value, bool) and bool not in value_types)
+        ):
+            return None
+        key.append((field, value))
+    if not key:
+        return None
+    return tuple(sorted(key))
+
+
+# *****************************
+def _record_key(record, fields):
+    """
+    builds the criteria key matching a record (many2one are read as [id, name])
+    on fields accepted by _simple_criteria_key
+    """
+    key = []
+    for field in fields:
+        value = record.get(field, False)
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else False
+        key.append((field, value))
+    return tuple(key)
+
+
+# *****************************
+class ProxyPool:
+    """
+    Pool of proxies to the object endpoint of an authenticated Connection,
+    each one with its own keep-alive transport, as a ServerProxy cannot be
+    shared between threads
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._idle = queue.LifoQueue()
+        self._proxies = []
+        self._lock = threading.Lock()
+
+    # *************************************************************
+    @contextmanager
+    def proxy(self):
+        """
+        Checks out a proxy for the duration of the with block
+        """
+        try:
+            proxy = self._idle.get_nowait()
+        except queue.Empty:
+            proxy = self.connection.get_server_proxy(
+                self.connection.xmlrpc_object_endpoint,
+                transport=self.connection.get_xmlrpc_transport(),
+            )
+            with self._lock:
+                self._proxies.append(proxy)
+        try:
+            yield proxy
+        finally:
+            self._idle.put(proxy)
+
+    # *************************************************************
+    def close(self):
+        """
+        Closes connections of all pooled proxies
+        """
+        with self._lock:
+            for proxy in self._proxies:
+                proxy("close")()
+            self._proxies = []
+            self._idle = queue.LifoQueue()
+
+
+# *****************************
+class Batch:
+    """
+    Queues odoo_create, odoo_write & odoo_execute calls, see Connection.batch
+
+    Odoo has no multicall endpoint, so queued calls are merged into as few
+    ORM calls as possible when the batch is flushed:
+    - creations on a model are sent as one multi-record create (Odoo >= 12)
+    - writes of identical values on a model are sent as one write
+    - executions of write/unlink (MERGEABLE_METHODS, or any method when
+      asked for) with identical parameters are sent as one call on all ids,
+      each future then gets the result of that call
+    Calls are sent in the order they were queued, a call is only merged
+    with an earlier one when no call in between touches the same records.
+    Each queued call returns a Future, a merged call that fails is retried
+    call by call, so that errors are set on the right futures only.
+    """
+
+    def __init__(self, connection, size):
+        self.connection = connection
+        self.size = size
+        self._groups = []
+        self._mergeable = {}
+        self._count = 0
+
+    # *************************************************************
+    def odoo_create(self, model_name, values):
+        """
+        Queues creation of a record, future result is the new id
+        """
+        return self._queue(("create", model_name), (model_name, "create", []), values)
+
+    # *************************************************************
+    def odoo_write(self, model_name, obj_ids, values):
+        """
+        Queues update of records
+        """
+        obj_ids = _as_id_list(obj_ids)
+        return self._queue(
+            ("write", model_name, repr(sorted(values.items()))),
+            (model_name, "write", [values]),
+            obj_ids,
+            obj_ids,
+        )
+
+    # *************************************************************
+    def odoo_execute(  # pylint: disable=too-many-arguments
+        self, model_name, method_name, obj_ids, parameters, merge=None
+    ):
+        """
+        Queues execution of a method on records, calls are merged when
+        merge is True (by default, for MERGEABLE_METHODS only) so method
+        must then return the same result whatever the records
+        """
+        if merge is None:
+            merge = method_name in MERGEABLE_METHODS
+        obj_ids = _as_id_list(obj_ids)
+        return self._queue(
+            ("execute", model_name, method_name, repr(parameters)) if merge else None,
+            (model_name, method_name, [parameters]),
+            obj_ids,
+            obj_ids,
+        )
+
+    # *************************************************************
+    def _queue(self, key, call, payload, obj_ids=()):
+        """
+        calls sharing the same key (None: never merged) are merged, call is
+        the (model, method, extra arguments) of the merged call
+        """
+        future = Future()
+        group = self._mergeable.get(key) if key is not None else None
+        if group is not None and not self._can_merge(group, obj_ids):
+            group = None
+        if group is None:
+            group = QueuedGroup(key, call, [], set())
+            self._groups.append(group)
+            if key is not None:
+                self._mergeable[key] = group
+        group.calls.append((future, payload))
+        group.ids.update(obj_ids)
+        self._count += 1
+        if self._count >= self.size:
+            self.flush()
+        return future
+
+    # *************************************************************
+    def _can_merge(self, group, obj_ids):
+        """
+        whether a call on obj_ids can be sent with group, i.e. before
+        the calls queued after group
+        """
+        obj_ids = set(obj_ids)
+        for later in reversed(self._groups):
+            if later is group:
+                return True
+            if later.key is None or not obj_ids.isdisjoint(later.ids):
+                return False
+        return False
+
+    # *************************************************************
+    def flush(self):
+        """
+        Sends queued calls, in order; futures of calls that could not be
+        sent get the error
+        """
+        groups = self._groups
+        self._groups = []
+        self._mergeable = {}
+        self._count = 0
+        for group in groups:
+            try:
+                if group.key is not None and group.key[0] == "create":
+                    self._send_creates(group.call[0], group.calls)
+                else:
+                    self._send_grouped(group.call, group.calls)
+            except Exception as err:  # pylint: disable=broad-except
+                self.connection.logger.error(
+                    "     WARNING: error when sending %s on %s: %s",
+                    group.call[1],
+                    group.call[0],
+                    to_string(err),
+                )
+                for future, _payload in group.calls:
+                    if not future.done():
+                        future.set_exception(err)
+
+    # *************************************************************
+    def cancel(self):
+        """
+        Drops queued calls
+        """
+        for group in self._groups:
+            for future, _payload in group.calls:
+                future.cancel()
+        self._groups = []
+        self._mergeable = {}
+        self._count = 0
+
+    # *************************************************************
+    def _call(self, model_name, method_name, args):
+        return self.connection.execute_kw(model_name, method_name, args)
+
+    # *************************************************************
+    def _send_creates(self, model_name, calls):
+        srv_ver = self.connection.srv_ver
+        if len(calls) > 1 and srv_ver is not None and srv_ver >= 12.0:
+            try:
+                new_ids = self._call(
+                    model_name, "create", [[values for _future, values in calls]]
+                )
+                for (future, _values), new_id in zip(calls, new_ids):
+                    future.set_result(new_id)
+                return
+            except xmlrpclib.Fault:
+                # isolate faulty calls
+                pass
+        for future, values in calls:
+            try:
+                future.set_result(self._call(model_name, "create", [values]))
+            except xmlrpclib.Fault as err:
+                self._log_fault("creating", model_name, values, err)
+                future.set_exception(err)
+
+    # *************************************************************
+    def _send_grouped(self, call, calls):
+        model_name, method_name, args = call
+        if len(calls) > 1:
+            all_ids = list(OrderedDict.fromkeys(i for _f, ids in calls for i in ids))
+            try:
+                result = self._call(model_name, method_name, [all_ids] + args)
+                for future, _ids in calls:
+                    future.set_result(result)
+                return
+            except xmlrpclib.Fault:
+                # isolate faulty calls
+                pass
+        for future, ids in calls:
+            try:
+                future.set_result(self._call(model_name, method_name, [ids] + args))
+            except xmlrpclib.Fault as err:
+                self._log_fault(method_name, model_name, ids, err)
+                future.set_exception(err)
+
+    # *************************************************************
+    def _log_fault(self, action, model_name, detail, err):
+        self.connection.logger.error(
+            "     WARNING: error when %s object: %s -> %s",
+            action,
+            model_name,
+            str(detail),
+        )
+        self.connection.logger.error(
+            "                    MSG: %s -> %s",
+            err.faultCode,
+            "".join(err.faultString.split("\n")[-2:]),
+        )
+
 
 # *****************************
 class Connection:
@@ -58,6 +515,22 @@ class Connection:
         # xmlrpc connection
         self.xmlrpc_uid = None
         self.xmlrpc_models = None
+        self.call_prefix = None
+        self._cached_config = None
+        self._default_fields = {}
+        self._field_types = {}
+        self.caches = {}
+        self.xmlid_index = {}
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        # pluggable, see instrumentation.CallStatistics, None to disable
+        self.instrumentation = CallStatistics()
+        self.xmlrpc_url = None
+        self.xmlrpc_object_endpoint = None
+        self.xmlrpc_transport = None
+        self.protocol = PROTOCOL_XMLRPC
+        self.proxy_pool = ProxyPool(self)
+        self.db_pool = None
         self.srv_ver = None
 
         if ctx is not None:
@@ -74,44 +547,39 @@ class Connection:
         if self.xmlrpc_uid is not None:
             return (self.xmlrpc_uid, self.xmlrpc_models)
 
-        odoo_host = self.context.get_config_value("odoo_host")
-        odoo_port = self.context.get_config_value("odoo_port")
-        if odoo_host is not None and odoo_port is not None:
-            if odoo_port == "443":
-                url = "https://" + odoo_host
-            else:
-                url = (
-                    "http://"
-                    + odoo_host
-                    + ":"
-                    + self.context.get_config_value("odoo_port")
-                )
-            odoo_username = self.context.get_config_value("odoo_username")
-        else:
+        url = get_odoo_url(self.context)
+        if url is None:
             self.logger.error("no connection information provided")
             return None
+        odoo_username = self.context.get_config_value("odoo_username")
 
         # *************************************************************
         # establish xmlrpc link
         # http://www.odoo.com/documentation/9.0/api_integration.html
 
-        dbproxy = xmlrpclib.ServerProxy("{}/xmlrpc/db".format(url), allow_none=True)
+        self.xmlrpc_url = url
+        self.protocol = self.context.get_config_value(
+            "odoo_protocol", default=PROTOCOL_XMLRPC
+        )
+        if self.protocol not in (PROTOCOL_XMLRPC, PROTOCOL_JSONRPC):
+            self.logger.error("Unknown odoo_protocol %s", self.protocol)
+            return None
+        self.xmlrpc_transport = self.get_xmlrpc_transport()
+        self.retry_policy = RetryPolicy.from_config(self.context)
+        self.circuit_breaker = CircuitBreaker.from_config(self.context)
+        dbproxy = self.get_server_proxy("xmlrpc/db")
 
         try:
             self.srv_ver = float(dbproxy.server_version().split("-")[0])
-        except ConnectionRefusedError:
+        except (ConnectionRefusedError, socket.timeout):
             self.logger.error("Cannot Connect to Odoo Server")
             return None
         self.logger.info(" Connected to odoo server version %s", str(self.srv_ver))
 
         if self.srv_ver > 8.0:
-            common = xmlrpclib.ServerProxy(
-                "{}/xmlrpc/2/common".format(url), allow_none=True
-            )
+            common = self.get_server_proxy("xmlrpc/2/common")
         else:
-            common = xmlrpclib.ServerProxy(
-                "{}/xmlrpc/common".format(url), allow_none=True
-            )
+            common = self.get_server_proxy("xmlrpc/common")
 
         try:
             common.version()
@@ -139,13 +607,10 @@ class Connection:
             return None
 
         if self.srv_ver > 8.0:
-            odoo_models = xmlrpclib.ServerProxy(
-                "{}/xmlrpc/2/object".format(url), allow_none=True, verbose=0
-            )
+            self.xmlrpc_object_endpoint = "xmlrpc/2/object"
         else:
-            odoo_models = xmlrpclib.ServerProxy(
-                "{}/xmlrpc/object".format(url), allow_none=True, verbose=0
-            )
+            self.xmlrpc_object_endpoint = "xmlrpc/object"
+        odoo_models = self.get_server_proxy(self.xmlrpc_object_endpoint)
 
         if not uid:
             self.logger.error(
@@ -157,41 +622,303 @@ class Connection:
 
         self.xmlrpc_uid = uid
         self.xmlrpc_models = odoo_models
+        self.call_prefix = None
 
         return (uid, odoo_models)
 
     # *************************************************************
-    def get_db_connection(self):
+    def get_default_fields(self, model_name):
         """
-        gets a New Postgresql connection to odoo
+        Default field projection of model_name, an empty list given
+        as fields to read methods still reads all fields
         """
-        db_name = self.context.get_config_value("db_name")
+        self._refresh_config_cache()
+        if model_name not in self._default_fields:
+            self._default_fields[model_name] = get_default_fields(
+                self.context, model_name
+            )
+        return self._default_fields[model_name]
 
-        if PGDB:
-            # *************************************************************
-            # connect to Db
-            ldsn = self.context.get_config_value("db_host") + ":5432"
-            if self.context.get_config_value("db_local") == "1":
-                return pgdb.connect(
-                    database=db_name,
-                    user=self.context.get_config_value("db_username"),
-                )
+    # *************************************************************
+    def _refresh_config_cache(self):
+        """
+        values read from config are cached until the config object
+        of the context is replaced (i.e. config is reloaded)
+        """
+        config = getattr(self.context, "config", None)
+        if config is not self._cached_config:
+            self._cached_config = config
+            self._default_fields = {}
+            self.call_prefix = None
+
+    # *************************************************************
+    def get_call_prefix(self):
+        """
+        (db_name, uid, password) arguments starting every execute_kw call,
+        resolved once from config after authentication
+        """
+        self._refresh_config_cache()
+        if self.call_prefix is None:
+            self.call_prefix = (
+                self.context.get_config_value("db_name"),
+                self.xmlrpc_uid,
+                self.context.get_config_value("odoo_password"),
+            )
+        return self.call_prefix
 
-            if self.context.get_config_value("db_password") is not None:
-                return pgdb.connect(
-                    database=db_name,
-                    dsn=ldsn,
-                    user=self.context.get_config_value("db_username"),
-                    password=self.context.get_config_value("db_password"),
+    # *************************************************************
+    def execute_kw(  # pylint: disable=too-many-arguments
+        self, model_name, method_name, args, kwargs=None, proxy=None
+    ):
+        """
+        Calls method_name of model_name through execute_kw, with the
+        language context, errors are raised.
+        proxy defaults to the object proxy of this connection.
+        Transient errors are retried according to retry_policy, and calls
+        fail fast with CircuitOpenError while circuit_breaker is open.
+        """
+        if kwargs is None:
+            kwargs = {"context": self.odoo_context}
+        elif "context" not in kwargs:
+            kwargs = dict(kwargs, context=self.odoo_context)
+
+        cache = self.caches.get(model_name)
+        if cache is not None:
+            if method_name not in CACHED_METHODS:
+                cache.clear()
+                try:
+                    return self._send(proxy, model_name, method_name, args, kwargs)
+                finally:
+                    # other threads may have cached data read before the
+                    # call was committed
+                    cache.clear()
+            key = freeze((method_name, args, kwargs))
+            hit, result = cache.get(key)
+            if not hit:
+                result = self._send(proxy, model_name, method_name, args, kwargs)
+                cache.put(key, result)
+            return copy.deepcopy(result)
+
+        return self._send(proxy, model_name, method_name, args, kwargs)
+
+    # *************************************************************
+    def _send(  # pylint: disable=too-many-arguments
+        self, proxy, model_name, method_name, args, kwargs
+    ):
+        """
+        Sends an execute_kw call, retrying it on transient errors
+        """
+        attempt = 0
+        while True:
+            trial = self.circuit_breaker.before_call()
+            try:
+                result = self._timed_call(proxy, model_name, method_name, args, kwargs)
+            except Exception as err:  # pylint: disable=broad-except
+                if classify_error(err) is None:
+                    # server did answer
+                    if isinstance(err, xmlrpclib.Fault):
+                        self.circuit_breaker.record_success()
+                    raise
+                self.circuit_breaker.record_failure()
+                if not self.retry_policy.should_retry(err, method_name, attempt):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                self.logger.warning(
+                    "Transient error calling %s on %s (%s), retrying in %.2fs",
+                    method_name,
+                    model_name,
+                    to_string(err),
+                    delay,
                 )
+                time.sleep(delay)
+                attempt += 1
+                continue
+            finally:
+                if trial:
+                    # outcome may not have been recorded
+                    self.circuit_breaker.end_trial()
+            self.circuit_breaker.record_success()
+            return result
 
-            return pgdb.connect(
-                database=db_name,
-                dsn=ldsn,
-                user=self.context.get_config_value("db_username"),
+    # *************************************************************
+    def _timed_call(  # pylint: disable=too-many-arguments
+        self, proxy, model_name, method_name, args, kwargs
+    ):
+        """
+        Sends one execute_kw request, recorded by instrumentation
+        """
+        proxy = proxy or self.xmlrpc_models
+        if self.instrumentation is None:
+            return proxy.execute_kw(
+                *self.get_call_prefix(), model_name, method_name, args, kwargs
             )
-        logging.error("No PGDB module")
-        return None
+
+        error = None
+        start = time.perf_counter()
+        try:
+            return proxy.execute_kw(
+                *self.get_call_prefix(), model_name, method_name, args, kwargs
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+            raise
+        finally:
+            transport = proxy("transport")
+            self.instrumentation.record(
+                model_name,
+                method_name,
+                time.perf_counter() - start,
+                getattr(transport, "last_request_size", 0),
+                getattr(transport, "last_response_size", 0),
+                error,
+            )
+
+    # *************************************************************
+    def enable_cache(
+        self, model_name, max_size=DEFAULT_CACHE_SIZE, ttl=DEFAULT_CACHE_TTL
+    ):
+        """
+        Caches results of read methods (search, search_read, read...) on
+        model_name, e.g. for reference data (countries, currencies...).
+        At most max_size results are kept for ttl seconds; any other call
+        on the model (write, create, unlink...) invalidates its cache.
+        """
+        self.caches[model_name] = LRUCache(max_size=max_size, ttl=ttl)
+
+    # *************************************************************
+    def disable_cache(self, model_name):
+        """
+        Stops caching results for model_name
+        """
+        self.caches.pop(model_name, None)
+
+    # *************************************************************
+    def cache_stats(self):
+        """
+        hits, misses & size of the cache of each model
+        """
+        return {model: cache.stats() for model, cache in self.caches.items()}
+
+    # *************************************************************
+    def get_xmlrpc_transport(self):
+        """
+        builds a keep-alive transport for xmlrpc_url and protocol, using
+        odoo_timeout and odoo_keepalive_max_idle (seconds) config values
+        """
+        return get_keepalive_transport(
+            self.xmlrpc_url,
+            timeout=self.context.get_config_value("odoo_timeout", datatype="float"),
+            max_idle=self.context.get_config_value(
+                "odoo_keepalive_max_idle", default=DEFAULT_MAX_IDLE, datatype="float"
+            ),
+            protocol=self.protocol,
+        )
+
+    # *************************************************************
+    def get_server_proxy(self, endpoint, transport=None):
+        """
+        builds a proxy for an endpoint of the Odoo server (a ServerProxy,
+        or its JSON-RPC counterpart when odoo_protocol is jsonrpc), sharing
+        (by default) the keep-alive transport of this connection
+        """
+        return get_server_proxy(
+            self.xmlrpc_url,
+            endpoint,
+            transport or self.xmlrpc_transport,
+            protocol=self.protocol,
+        )
+
+    # *************************************************************
+    def close(self):
+        """
+        closes the connection kept alive to the Odoo server
+        """
+        if self.xmlrpc_transport is not None:
+            self.xmlrpc_transport.close()
+        self.proxy_pool.close()
+        if self.db_pool is not None:
+            self.db_pool.close()
+
+    # *************************************************************
+    def get_db_connection(self):
+        """
+        gets a Postgresql connection to odoo from the pool of connections
+        (see dbpool.DbConnectionPool.from_config for config values), its
+        close() method gives it back to the pool. None if it cannot be opened,
+        or if none is released within db_pool_timeout seconds
+        """
+        if self.db_pool is None:
+            try:
+                self.db_pool = DbConnectionPool.from_config(self.context)
+            except ValueError as err:
+                self.logger.error(str(err))
+                return None
+        try:
+            return self.db_pool.acquire()
+        except ImportError as err:
+            self.logger.error("No database driver module: %s", str(err))
+            return None
+        except TimeoutError as err:
+            self.logger.error(str(err))
+            return None
+
+    # *************************************************************
+    @contextmanager
+    def db_session(self):
+        """
+        Context manager providing a Postgresql connection, given back to the
+        pool (its transaction rolled back) on exit, None if it cannot be opened
+        """
+        db_conn = self.get_db_connection()
+        if db_conn is None:
+            self.logger.error("Not Connected to Postgresql Database")
+        try:
+            yield db_conn
+        finally:
+            if db_conn is not None:
+                db_conn.close()
+
+    # *************************************************************
+    def db_iter_query(self, query, params=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Generator yielding the rows (tuples) returned by an SQL query, read
+        directly from the Odoo database by batches of batch_size from a
+        server-side cursor
+        """
+        with self.db_session() as db_conn:
+            if db_conn is not None:
+                yield from iter_query(db_conn, query, params, batch_size)
+
+    # *************************************************************
+    def db_copy_rows(self, query):
+        """
+        Generator yielding the rows returned by an SQL query through
+        COPY ... TO STDOUT (fastest path), as tuples of strings (None for NULL)
+        """
+        with self.db_session() as db_conn:
+            if db_conn is not None:
+                yield from copy_rows(db_conn, query)
+
+    # *************************************************************
+    def db_copy_to_csv(self, query, output, header=True):
+        """
+        Writes the rows returned by an SQL query to output (file name or text
+        file) as CSV through COPY ... TO STDOUT, returns the number of rows,
+        None if not connected
+        """
+        with self.db_session() as db_conn:
+            if db_conn is None:
+                return None
+            return copy_to_csv(db_conn, query, output, header)
+
+    # *************************************************************
+    def staging_loader(self, table, columns, keep=False):
+        """
+        StagingLoader streaming data into the staging table (created with
+        columns, a list of (name, SQL type)) through COPY, to fill Odoo
+        tables with set-based SQL
+        """
+        return StagingLoader(self, table, columns, keep)
 
     # *************************************************************************
     def odoo_search_create_or_write(  # pylint: disable=too-many-arguments,dangerous-default-value,too-many-branches
@@ -213,14 +940,14 @@ class Connection:
                 self.logger.error("Not Connected to Odoo Database/Server")
                 return None
 
-            result_params = {"offset": 0}
+            # at most 2 ids are needed to tell "create vs write vs ambiguous"
             if can_be_archived:
                 full_search = copy.copy(search_criteria)
                 for val in ALL_INSTANCES_FILTER:
                     full_search.append(val)
-                found = self.odoo_search(model_name, full_search, result_params)
+                found = self.odoo_idsearch(model_name, full_search, limit=2)
             else:
-                found = self.odoo_search(model_name, search_criteria, result_params)
+                found = self.odoo_idsearch(model_name, search_criteria, limit=2)
 
                 if found is None:
                     return None
@@ -229,15 +956,7 @@ class Connection:
             # create only if do not exist
             if lfound == 0:
                 try:
-                    obj_id = self.xmlrpc_models.execute_kw(
-                        self.context.get_config_value("db_name"),
-                        self.xmlrpc_uid,
-                        self.context.get_config_value("odoo_password"),
-                        model_name,
-                        "create",
-                        [values],
-                        {"context": self.odoo_context},
-                    )
+                    obj_id = self.execute_kw(model_name, "create", [values])
                 except xmlrpclib.Fault as err:
                     self.logger.error(
                         "Failed to create record %s [ %s ] %s",
@@ -247,18 +966,10 @@ class Connection:
                     )
 
             elif lfound == 1:
-                obj_id = found[0]["id"]
+                obj_id = found[0]
                 try:
                     if not create_only:
-                        self.xmlrpc_models.execute_kw(
-                            self.context.get_config_value("db_name"),
-                            self.xmlrpc_uid,
-                            self.context.get_config_value("odoo_password"),
-                            model_name,
-                            "write",
-                            [obj_id, values],
-                            {"context": self.odoo_context},
-                        )
+                        self.execute_kw(model_name, "write", [obj_id, values])
                 except xmlrpclib.Fault as err:
                     self.logger.error(
                         "Failed to write record %s (%s) [%s] -> %s",
@@ -285,25 +996,357 @@ class Connection:
                 to_string(err),
             )
 
+    # *************************************************************************
+    def odoo_search_create_or_write_many(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        self,
+        model_name,
+        rows,
+        create_only=False,
+        can_be_archived=False,
+        chunk_size=200,
+    ):
+        """
+        Bulk version of odoo_search_create_or_write, rows is an iterable of
+        (search_criteria, values) pairs.
+
+        Lookups made of ("field", "=", value) criteria on simple fields
+        (char, integer, many2one given as an id..., see
+        CLIENT_MATCHED_TYPES) are resolved with OR-combined search_read
+        calls (other ones are searched one by one),
+        then missing records are created and found ones written in groups.
+
+        Returns a list of UpsertResult(status, id, error), one per row
+        """
+        rows = list(rows)
+        results = [None] * len(rows)
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if self.xmlrpc_models is None:
+            self.logger.error("Not Connected to Odoo Database/Server")
+            return None
+
+        # *************************************************************
+        # resolve lookups
+        found = self._upsert_lookup(model_name, rows, can_be_archived, chunk_size)
+
+        to_create = OrderedDict()  # criteria key -> row indexes
+        to_write = []
+        for idx, (search_criteria, values) in enumerate(rows):
+            key, ids = found[idx]
+            if ids is None:
+                results[idx] = UpsertResult(UPSERT_FAILED, None, "search failed")
+            elif not ids:
+                to_create.setdefault(key if key is not None else idx, []).append(idx)
+            elif len(ids) == 1:
+                if create_only:
+                    results[idx] = UpsertResult(UPSERT_FOUND, ids[0], None)
+                else:
+                    to_write.append((idx, ids[0]))
+            else:
+                self.logger.warning(
+                    "Failed to update record  ( %s ) too many objects found" " for %s",
+                    model_name,
+                    str(search_criteria),
+                )
+                results[idx] = UpsertResult(UPSERT_AMBIGUOUS, None, None)
+
+        # *************************************************************
+        # create missing records, rows sharing the same criteria are
+        # then written on the created record
+        created = self._upsert_create(
+            model_name,
+            [(idxs[0], rows[idxs[0]][1]) for idxs in to_create.values()],
+            chunk_size,
+        )
+        for idxs in to_create.values():
+            results[idxs[0]] = created[idxs[0]]
+            obj_id = created[idxs[0]].id
+            for idx in idxs[1:]:
+                if obj_id is None:
+                    results[idx] = created[idxs[0]]
+                elif create_only:
+                    results[idx] = UpsertResult(UPSERT_FOUND, obj_id, None)
+                else:
+                    to_write.append((idx, obj_id))
+
+        # *************************************************************
+        # write found records, grouped by identical values
+        written = self._upsert_write(
+            model_name,
+            [(idx, obj_id, rows[idx][1]) for idx, obj_id in to_write],
+            chunk_size,
+        )
+        for idx, result in written.items():
+            results[idx] = result
+
+        return results
+
+    # *************************************************************
+    def _upsert_lookup(self, model_name, rows, can_be_archived, chunk_size):
+        """
+        Finds the ids matching each row criteria, returns a list
+        of (criteria key, ids) where ids is None if search failed
+        """
+        found = [None] * len(rows)
+        groups = OrderedDict()  # searched fields -> criteria key -> row indexes
+        field_types = self.get_field_types(model_name) if rows else {}
+        for idx, (search_criteria, _values) in enumerate(rows):
+            key = _simple_criteria_key(search_criteria, field_types)
+            if key is None:
+                domain = list(search_criteria)
+                if can_be_archived:
+                    domain += ALL_INSTANCES_FILTER
+                found[idx] = (
+                    None,
+                    self._upsert_search(model_name, "search", domain, {"limit": 2}),
+                )
+            else:
+                fields = tuple(field for field, _value in key)
+                groups.setdefault(fields, OrderedDict()).setdefault(key, []).append(idx)
+
+        for fields, keys in groups.items():
+            keys = list(keys.items())
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start : start + chunk_size]
+                if len(fields) == 1:
+                    domain = [(fields[0], "in", [key[0][1] for key, _idxs in chunk])]
+                else:
+                    domain = or_domains(
+                        [[(fld, "=", val) for fld, val in key] for key, _idxs in chunk]
+                    )
+                if can_be_archived:
+                    domain += ALL_INSTANCES_FILTER
+                records = self._upsert_search(
+                    model_name, "search_read", domain, {"fields": list(fields)}
+                )
+                matches = {}
+                for record in records or ():
+                    matches.setdefault(_record_key(record, fields), []).append(
+                        record["id"]
+                    )
+                for key, idxs in chunk:
+                    ids = None if records is None else matches.get(key, [])
+                    for idx in idxs:
+                        found[idx] = (key, ids)
+        return found
+
+    # *************************************************************
+    def get_field_types(self, model_name):
+        """
+        Type (char, many2one...) of each field of model_name, read once
+        with fields_get, empty if it cannot be read
+        """
+        if model_name not in self._field_types:
+            try:
+                fields = self.execute_kw(
+                    model_name, "fields_get", [], {"attributes": ["type"]}
+                )
+            except xmlrpclib.Fault as err:
+                self.logger.error(
+                    "Cannot get fields of model %s: %s", model_name, to_string(err)
+                )
+                return {}
+            self._field_types[model_name] = {
+                name: attrs.get("type") for name, attrs in fields.items()
+            }
+        return self._field_types[model_name]
+
+    # *************************************************************
+    def _upsert_search(self, model_name, method, domain, kwargs=None):
+        """
+        search or search_read used by bulk upsert, returns None on failure
+        """
+        try:
+            result = self.execute_kw(model_name, method, [domain], kwargs)
+            return result
+        except xmlrpclib.Fault as err:
+            self.logger.error(
+                "WARN Error when looking for records of model: %s [ %s ] %s",
+                model_name,
+                to_string(domain),
+                to_string(err),
+            )
+            return None
+
+    # *************************************************************
+    def _upsert_create(self, model_name, to_create, chunk_size):
+        """
+        creates records in chunks (one by one on failure or before odoo 12)
+        returns a dict row index -> UpsertResult
+        """
+        results = {}
+        multi = self.srv_ver is not None and self.srv_ver >= 12.0
+        step = chunk_size if multi else 1
+        for start in range(0, len(to_create), step):
+            chunk = to_create[start : start + step]
+            if len(chunk) > 1:
+                try:
+                    new_ids = self.execute_kw(
+                        model_name, "create", [[values for _idx, values in chunk]]
+                    )
+                    for (idx, _values), obj_id in zip(chunk, new_ids):
+                        results[idx] = UpsertResult(UPSERT_CREATED, obj_id, None)
+                    continue
+                except xmlrpclib.Fault:
+                    # isolate faulty rows
+                    pass
+            for idx, values in chunk:
+                try:
+                    obj_id = self.execute_kw(model_name, "create", [values])
+                    results[idx] = UpsertResult(UPSERT_CREATED, obj_id, None)
+                except xmlrpclib.Fault as err:
+                    self.logger.error(
+                        "Failed to create record %s [ %s ] %s",
+                        model_name,
+                        to_string(values),
+                        to_string(err),
+                    )
+                    results[idx] = UpsertResult(UPSERT_FAILED, None, to_string(err))
+        return results
+
+    # *************************************************************
+    def _upsert_write(self, model_name, to_write, chunk_size):
+        """
+        writes records sharing the same values in one call (one by one
+        on failure), returns a dict row index -> UpsertResult
+        """
+        results = {}
+        groups = OrderedDict()
+        for idx, obj_id, values in to_write:
+            groups.setdefault(repr(sorted(values.items())), []).append(
+                (idx, obj_id, values)
+            )
+        for group in groups.values():
+            values = group[0][2]
+            for start in range(0, len(group), chunk_size):
+                chunk = group[start : start + chunk_size]
+                if len(chunk) > 1:
+                    try:
+                        self.execute_kw(
+                            model_name,
+                            "write",
+                            [sorted({obj_id for _idx, obj_id, _val in chunk}), values],
+                        )
+                        for idx, obj_id, _val in chunk:
+                            results[idx] = UpsertResult(UPSERT_UPDATED, obj_id, None)
+                        continue
+                    except xmlrpclib.Fault:
+                        # isolate faulty rows
+                        pass
+                for idx, obj_id, _val in chunk:
+                    try:
+                        self.execute_kw(model_name, "write", [obj_id, values])
+                        results[idx] = UpsertResult(UPSERT_UPDATED, obj_id, None)
+                    except xmlrpclib.Fault as err:
+                        self.logger.error(
+                            "Failed to write record %s (%s) [%s] -> %s",
+                            model_name,
+                            to_string(obj_id),
+                            to_string(values),
+                            to_string(err),
+                        )
+                        results[idx] = UpsertResult(
+                            UPSERT_FAILED, obj_id, to_string(err)
+                        )
+        return results
+
+    # *************************************************************
+    def parallel_execute(  # pylint: disable=too-many-arguments
+        self, model_name, method_name, chunks, workers=4, args=(), kwargs=None
+    ):
+        """
+        Calls method_name on each chunk (of ids, or values...) using workers
+        threads, each with its own pooled proxy.
+        Every call gets [chunk, *args] as arguments, results are returned
+        in the order of chunks, None for a chunk that failed.
+        """
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if self.xmlrpc_models is None:
+            self.logger.error("Not Connected to Odoo Database/Server")
+            return None
+
+        def execute_chunk(chunk):
+            with self.proxy_pool.proxy() as proxy:
+                try:
+                    return self.execute_kw(
+                        model_name,
+                        method_name,
+                        [chunk] + list(args),
+                        kwargs,
+                        proxy=proxy,
+                    )
+                except xmlrpclib.Fault as err:
+                    self.logger.error(
+                        "     WARNING: error when executing %s on object: %s -> %s",
+                        method_name,
+                        model_name,
+                        str(chunk),
+                    )
+                    self.logger.error(
+                        "                    MSG: %s-> %s",
+                        err.faultCode,
+                        "".join(err.faultString.split("\n")[-2:]),
+                    )
+                    return None
+                except (xmlrpclib.ProtocolError, OSError) as err:
+                    self.logger.error(
+                        "     WARNING: error when executing %s on object: %s -> %s",
+                        method_name,
+                        model_name,
+                        to_string(err),
+                    )
+                    return None
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="odoo-rpc"
+        ) as executor:
+            return list(executor.map(execute_chunk, chunks))
+
     # *************************************************************
-    def odoo_search(self, model_name, search_conditions, result_parameters):
+    @contextmanager
+    def batch(self, size=100):
         """
-        Search elements in odoo
+        Context manager queuing odoo_create, odoo_write and odoo_execute
+        calls made on the yielded Batch, that are merged in as few requests
+        as possible and sent every size calls and when leaving the block.
+        Queued calls return futures, they are sent in order but should not
+        depend on results of each other.
+
+            with connection.batch() as batch:
+                futures = [batch.odoo_create("res.partner", vals) for vals in rows]
+            new_ids = [future.result() for future in futures]
         """
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
+        queued = Batch(self, size)
+        try:
+            yield queued
+        except BaseException:
+            queued.cancel()
+            raise
+        queued.flush()
+
+    # *************************************************************
+    def odoo_search(
+        self, model_name, search_conditions, result_parameters, fields=None
+    ):
+        """
+        Search elements in odoo, reading only fields if given (by default,
+        fields configured for the model, see get_default_fields)
+        """
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if fields is None:
+            fields = self.get_default_fields(model_name)
         try:
             if self.xmlrpc_models is not None:
-                if result_parameters:
-                    result_parameters["context"] = self.odoo_context
-                else:
-                    result_parameters = {"context": self.odoo_context}
+                result_parameters = dict(result_parameters or {})
+                if fields and "fields" not in result_parameters:
+                    result_parameters["fields"] = list(fields)
 
                 if self.srv_ver > 8.0:
-                    result = self.xmlrpc_models.execute_kw(
-                        self.context.get_config_value("db_name"),
-                        self.xmlrpc_uid,
-                        self.context.get_config_value("odoo_password"),
+                    result = self.execute_kw(
                         model_name,
                         "search_read",
                         [search_conditions],
@@ -311,24 +1354,10 @@ class Connection:
                     )
                     return result
 
-                found = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    "search",
-                    [search_conditions],
-                    {"context": self.odoo_context},
-                )
+                found = self.execute_kw(model_name, "search", [search_conditions])
                 if found:
-                    result = self.xmlrpc_models.execute_kw(
-                        self.context.get_config_value("db_name"),
-                        self.xmlrpc_uid,
-                        self.context.get_config_value("odoo_password"),
-                        model_name,
-                        "read",
-                        [found],
-                        {"context": self.odoo_context},
+                    result = self.execute_kw(
+                        model_name, "read", [found] + ([list(fields)] if fields else [])
                     )
                     return result
             else:
@@ -345,23 +1374,310 @@ class Connection:
             return ()
 
     # *************************************************************
-    def odoo_idsearch(self, model_name, search_conditions):
+    def _search_read(self, model_name, domain, fields):
         """
-        Search id of elements in odoo with language support enabled
+        records matching domain (search_read, or search & read before
+        Odoo 9), errors are raised
+        """
+        if self.srv_ver > 8.0:
+            return self.execute_kw(
+                model_name, "search_read", [domain], {"fields": list(fields)}
+            )
+        found = self.execute_kw(model_name, "search", [domain])
+        if not found:
+            return []
+        return self.execute_kw(model_name, "read", [found, list(fields)])
+
+    # *************************************************************
+    def iter_search(self, model_name, domain, fields=None, page_size=1000):
+        """
+        Generator yielding the records matching domain, read by pages of
+        page_size records ordered by id. Pages are selected with an
+        id > last_id condition (keyset pagination) rather than an offset,
+        so later pages are as fast as the first ones.
+        Only fields are read if given (by default, fields configured for the
+        model, see get_default_fields)
+        """
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if fields is None:
+            fields = self.get_default_fields(model_name)
+        if self.xmlrpc_models is None:
+            self.logger.error("Not Connected to Odoo Database/Server")
+            return
+
+        last_id = 0
+        while True:
+            page_domain = list(domain) + [("id", ">", last_id)]
+            try:
+                if self.srv_ver > 8.0:
+                    kwargs = {"limit": page_size, "order": "id"}
+                    if fields:
+                        kwargs["fields"] = list(fields)
+                    records = self.execute_kw(
+                        model_name, "search_read", [page_domain], kwargs
+                    )
+                else:
+                    found = self.execute_kw(
+                        model_name,
+                        "search",
+                        [page_domain],
+                        {"limit": page_size, "order": "id"},
+                    )
+                    records = []
+                    if found:
+                        records = self.execute_kw(
+                            model_name,
+                            "read",
+                            [found] + ([list(fields)] if fields else []),
+                        )
+            except xmlrpclib.Fault:
+                logging.exception(
+                    "WARNING: error when searching for object: %s -> %s",
+                    model_name,
+                    str(page_domain),
+                )
+                return
+
+            for record in records:
+                yield record
+            if len(records) < page_size:
+                return
+            last_id = max(record["id"] for record in records)
+
+    # *************************************************************
+    def iter_read_group(  # pylint: disable=too-many-arguments
+        self,
+        model_name,
+        domain,
+        fields,
+        groupby,
+        lazy=False,
+        orderby=None,
+        page_size=1000,
+    ):
+        """
+        Generator yielding groups computed by Odoo (read_group), as compact
+        rows: groupby values (ids for many2one), aggregated fields and the
+        number of records under __count.
+        Groups are read by pages of page_size (offset/limit of read_group).
+        """
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if self.xmlrpc_models is None:
+            self.logger.error("Not Connected to Odoo Database/Server")
+            return
+
+        if isinstance(groupby, str):
+            groupby = [groupby]
+        groupby = list(groupby)
+        if lazy:
+            groupby_keys = groupby[:1]
+        else:
+            groupby_keys = groupby
+        orderby = orderby or ",".join(gby.split(":")[0] for gby in groupby_keys)
+
+        offset = 0
+        while True:
+            kwargs = {
+                "orderby": orderby,
+                "lazy": lazy,
+                "offset": offset,
+                "limit": page_size,
+            }
+            try:
+                groups = self.execute_kw(
+                    model_name, "read_group", [domain, fields, groupby], kwargs
+                )
+            except xmlrpclib.Fault as err:
+                self.logger.error(
+                    "     WARNING: error when grouping object: %s -> %s",
+                    model_name,
+                    str(domain),
+                )
+                self.logger.error(
+                    "                    MSG: %s -> %s",
+                    err.faultCode,
+                    "".join(err.faultString.split("\n")[-2:]),
+                )
+                return
+
+            for group in groups:
+                yield _compact_group(group, groupby_keys, lazy)
+            if len(groups) < page_size:
+                return
+            offset += page_size
+
+    # *************************************************************
+    def odoo_read_group(  # pylint: disable=too-many-arguments
+        self,
+        model_name,
+        domain,
+        fields,
+        groupby,
+        lazy=False,
+        orderby=None,
+        page_size=1000,
+    ):
+        """
+        Aggregates records in Odoo (read_group), returns the list of compact
+        rows yielded by iter_read_group
+        """
+        return list(
+            self.iter_read_group(
+                model_name, domain, fields, groupby, lazy, orderby, page_size
+            )
+        )
+
+    # *************************************************************
+    def load_xmlid_index(self, modules=None, models=None, page_size=5000):
+        """
+        Preloads, in one paged pass, the external ids (ir.model.data) of
+        the given modules and/or models in xmlid_index, a dict
+        "module.name" -> (model, res_id) used by resolve_xmlid/resolve_many.
+        Returns the number of loaded external ids
+        """
+        domain = []
+        if modules:
+            domain.append(("module", "in", list(modules)))
+        if models:
+            domain.append(("model", "in", list(models)))
+        count = 0
+        for data in self.iter_search(
+            "ir.model.data",
+            domain,
+            ["module", "name", "model", "res_id"],
+            page_size=page_size,
+        ):
+            self.xmlid_index["{}.{}".format(data["module"], data["name"])] = (
+                data["model"],
+                data["res_id"],
+            )
+            count += 1
+        return count
+
+    # *************************************************************
+    def resolve_many(self, xmlids, model_name=None, chunk_size=500):
+        """
+        Returns a dict xmlid -> res_id (None if unknown, or not a record of
+        model_name when given), external ids missing from xmlid_index are
+        fetched with a few grouped searches and added to the index, unknown
+        ones as (None, None) so that they are not searched again
+        """
+        xmlids = list(xmlids)
+        missing = []
+        for xmlid in OrderedDict.fromkeys(xmlids):
+            if xmlid in self.xmlid_index:
+                continue
+            if "." in xmlid:
+                missing.append(xmlid)
+            else:
+                self.logger.warning("Invalid external id %s (no module)", xmlid)
+                self.xmlid_index[xmlid] = (None, None)
+        if missing and self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        for chunk in chunked(missing, chunk_size):
+            domain = or_domains(
+                [
+                    [("module", "=", module), ("name", "=", name)]
+                    for module, name in (xmlid.split(".", 1) for xmlid in chunk)
+                ]
+            )
+            try:
+                found = self._search_read(
+                    "ir.model.data", domain, ["module", "name", "model", "res_id"]
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                # not marked as unknown, searched again next time
+                self.logger.error(
+                    "Cannot resolve external ids %s: %s", chunk, to_string(err)
+                )
+                continue
+            # unknown unless found
+            self.xmlid_index.update((xmlid, (None, None)) for xmlid in chunk)
+            for data in found:
+                self.xmlid_index["{}.{}".format(data["module"], data["name"])] = (
+                    data["model"],
+                    data["res_id"],
+                )
+
+        result = {}
+        for xmlid in xmlids:
+            model, res_id = self.xmlid_index.get(xmlid, (None, None))
+            if model_name is not None and model is not None and model != model_name:
+                self.logger.warning(
+                    "External id %s is a %s record, not a %s one",
+                    xmlid,
+                    model,
+                    model_name,
+                )
+                res_id = None
+            result[xmlid] = res_id
+        return result
+
+    # *************************************************************
+    def resolve_xmlid(self, xmlid, model_name=None):
+        """
+        Returns the id of the record with external id xmlid ("module.name"),
+        None if unknown
+        """
+        return self.resolve_many([xmlid], model_name)[xmlid]
+
+    # *************************************************************
+    def register_xmlid(self, xmlid, model_name, res_id, create=False):
+        """
+        Adds an external id to xmlid_index, if create is True it is also
+        created in Odoo (ir.model.data). Returns False on failure
+        """
+        if create:
+            module, name = xmlid.split(".", 1)
+            try:
+                self.execute_kw(
+                    "ir.model.data",
+                    "create",
+                    [
+                        {
+                            "module": module,
+                            "name": name,
+                            "model": model_name,
+                            "res_id": res_id,
+                        }
+                    ],
+                )
+            except xmlrpclib.Fault as err:
+                self.logger.error(
+                    "Failed to create external id %s for %s (%s) -> %s",
+                    xmlid,
+                    model_name,
+                    to_string(res_id),
+                    to_string(err),
+                )
+                return False
+        self.xmlid_index[xmlid] = (model_name, res_id)
+        return True
+
+    # *************************************************************
+    def odoo_idsearch(  # pylint: disable=too-many-arguments
+        self, model_name, search_conditions, limit=None, offset=0, order=None
+    ):
+        """
+        Search id of elements in odoo with language support enabled, at most
+        limit ids if given (e.g. limit=2 is enough to tell if a record is unique)
         """
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
         try:
             result = None
             if self.xmlrpc_models is not None:
-                result = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    "search",
-                    [search_conditions],
-                    {"context": self.odoo_context},
+                kwargs = {}
+                if limit:
+                    kwargs["limit"] = limit
+                if offset:
+                    kwargs["offset"] = offset
+                if order:
+                    kwargs["order"] = order
+                result = self.execute_kw(
+                    model_name, "search", [search_conditions], kwargs
                 )
 
             return result
@@ -374,22 +1690,45 @@ class Connection:
             return ()
 
     # *************************************************************
-    def odoo_read(self, model_name, ids):
+    def odoo_count(self, model_name, search_conditions):
         """
-        Read elements in odoo
+        Number of elements matching search_conditions (search_count), no
+        record is transferred. Returns None on failure
         """
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
-
+        if self.xmlrpc_models is None:
+            self.logger.error("Not Connected to Odoo Database/Server")
+            return None
         try:
-            result = self.xmlrpc_models.execute_kw(
-                self.context.get_config_value("db_name"),
-                self.xmlrpc_uid,
-                self.context.get_config_value("odoo_password"),
+            return self.execute_kw(model_name, "search_count", [search_conditions])
+        except xmlrpclib.Fault as err:
+            self.logger.error(
+                "     WARNING: error when counting object: %s -> %s",
                 model_name,
-                "read",
-                [ids],
-                {"context": self.odoo_context},
+                str(search_conditions),
+            )
+            self.logger.error(
+                "                    MSG: %s -> %s",
+                err.faultCode,
+                "".join(err.faultString.split("\n")[-2:]),
+            )
+            return None
+
+    # *************************************************************
+    def odoo_read(self, model_name, ids, fields=None):
+        """
+        Read elements in odoo, only fields if given (by default,
+        fields configured for the model, see get_default_fields)
+        """
+        if self.xmlrpc_uid is None:
+            self.get_odoo_xmlrpc_connection()
+        if fields is None:
+            fields = self.get_default_fields(model_name)
+
+        try:
+            result = self.execute_kw(
+                model_name, "read", [ids] + ([list(fields)] if fields else [])
             )
             return result
 
@@ -414,15 +1753,7 @@ class Connection:
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
         try:
-            result = self.xmlrpc_models.execute_kw(
-                self.context.get_config_value("db_name"),
-                self.xmlrpc_uid,
-                self.context.get_config_value("odoo_password"),
-                model_name,
-                "write",
-                [obj_id, values],
-                {"context": self.odoo_context},
-            )
+            result = self.execute_kw(model_name, "write", [obj_id, values])
             return result
         except xmlrpclib.Fault as err:
             self.logger.error(
@@ -439,22 +1770,18 @@ class Connection:
 
     # *************************************************************
     # Create  new element in odoo   // Single Object
-    def odoo_create(self, model_name, *values):
+    def odoo_create(self, model_name, *values, xmlid=None):
         """
-        Create a new record
+        Create a new record, when an xmlid ("module.name") is given, it is
+        registered as the external id of the (first) created record
         """
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
         try:
-            result = self.xmlrpc_models.execute_kw(
-                self.context.get_config_value("db_name"),
-                self.xmlrpc_uid,
-                self.context.get_config_value("odoo_password"),
-                model_name,
-                "create",
-                [values],
-                {"context": self.odoo_context},
-            )
+            result = self.execute_kw(model_name, "create", [values])
+            if xmlid is not None and result:
+                new_id = result[0] if isinstance(result, list) else result
+                self.register_xmlid(xmlid, model_name, new_id, create=True)
             return result
         except xmlrpclib.Fault as err:
             self.logger.error(
@@ -470,34 +1797,24 @@ class Connection:
             return None
 
     # *************************************************************
-    def odoo_delete(self, model_name, obj_ids):
+    def odoo_delete(self, model_name, obj_ids, chunk_size=None, workers=1):
         """
         Deletes  new element in odoo
+        When chunk_size is given, ids are deleted by chunks (see
+        odoo_delete_chunked) and True is returned if all were deleted
         """
         if self.xmlrpc_uid is None:
             self.get_odoo_xmlrpc_connection()
+        if chunk_size is not None and isinstance(obj_ids, (tuple, list)):
+            return not self.odoo_delete_chunked(
+                model_name, obj_ids, chunk_size=chunk_size, workers=workers
+            )
         try:
             result = False
             if isinstance(obj_ids, (tuple, list)):
-                result = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    "unlink",
-                    [obj_ids],
-                    {"context": self.odoo_context},
-                )
+                result = self.execute_kw(model_name, "unlink", [obj_ids])
             elif isinstance(obj_ids, int):
-                result = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    "unlink",
-                    [[obj_ids]],
-                    {"context": self.odoo_context},
-                )
+                result = self.execute_kw(model_name, "unlink", [[obj_ids]])
             return result
         except xmlrpclib.Fault as err:
             self.logger.warning(
@@ -512,6 +1829,33 @@ class Connection:
             )
             return None
 
+    # *************************************************************
+    def odoo_delete_chunked(self, model_name, obj_ids, chunk_size=1000, workers=1):
+        """
+        Deletes records by chunks of chunk_size ids, each one in its own
+        transaction, with at most workers requests in flight.
+        Failing chunks do not stop the deletion, returns the list of ids
+        that could not be deleted
+        """
+        chunks = list(chunked(obj_ids, chunk_size))
+        results = self.parallel_execute(model_name, "unlink", chunks, workers=workers)
+        if results is None:
+            return list(obj_ids)
+        failed = [
+            obj_id
+            for chunk, result in zip(chunks, results)
+            if not result
+            for obj_id in chunk
+        ]
+        if failed:
+            self.logger.warning(
+                "     WARNING: %d/%d %s records could not be deleted",
+                len(failed),
+                len(obj_ids),
+                model_name,
+            )
+        return failed
+
     # *************************************************************
     # Execute stuff in odoo   // Single Object
     def odoo_execute(self, model_name, method_name, obj_ids, parameters):
@@ -523,24 +1867,10 @@ class Connection:
         try:
             result = False
             if isinstance(obj_ids, (tuple, list)):
-                result = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    method_name,
-                    [obj_ids, parameters],
-                    {"context": self.odoo_context},
-                )
+                result = self.execute_kw(model_name, method_name, [obj_ids, parameters])
             elif isinstance(obj_ids, int):
-                result = self.xmlrpc_models.execute_kw(
-                    self.context.get_config_value("db_name"),
-                    self.xmlrpc_uid,
-                    self.context.get_config_value("odoo_password"),
-                    model_name,
-                    method_name,
-                    [[obj_ids], parameters],
-                    {"context": self.odoo_context},
+                result = self.execute_kw(
+                    model_name, method_name, [[obj_ids], parameters]
                 )
             return result
         except xmlrpclib.Fault as err:
@@ -10,6 +10,7 @@ Utility functions to convert data
 """
 
 import configparser
+import contextlib
 import datetime
 import getopt
 import logging
@@ -19,20 +20,7 @@ import traceback
 from abc import ABCMeta, abstractmethod
 
 from . import odooconnection
-
-try:
-    import odoo
-
-    ODOO_OK = True
-except ImportError:
-    ODOO_OK = False
-    logging.error("error on Odoo import")
-
-try:
-    from odoo.tools import config
-except ImportError:
-    ODOO_OK = False
-    logging.error("ImportError: config from odoo.tools")
+from .instrumentation import CallStatistics
 
 # ************************************************
 #  CONSTANTS
@@ -40,6 +28,85 @@ except ImportError:
 FORMAT_CONSOLE = "%(levelname)s - %(message)s"
 FORMAT_FIC = "%(asctime)s - %(levelname)s - %(message)s"
 
+DEFAULT_CHUNK_SIZE = 1000
+
+# (script, model name, domain, context) of the run_in_odoo_parallel in
+# progress, inherited by forked workers
+_PARALLEL_RUN = None
+
+
+# ************************************************
+def import_odoo():
+    """
+    Imports odoo when an embedded Odoo is actually needed,
+    remote-only scripts do not pay for it. Returns the odoo module, None if
+    Odoo is not installed
+    """
+    try:
+        import odoo  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        logging.error("error on Odoo import")
+        return None
+    return odoo
+
+
+# ************************************************
+def environment_manager(odoo):
+    """
+    odoo.api.Environment.manage() context, a no-op since Odoo 15, removed
+    in later versions
+    """
+    manage = getattr(odoo.api.Environment, "manage", None)
+    return manage() if manage is not None else contextlib.nullcontext()
+
+
+# ************************************************
+def split_id_ranges(ids, chunk_size):
+    """
+    Splits sorted ids into (first id, last id) ranges of chunk_size ids
+    """
+    return [
+        (ids[idx], ids[min(idx + chunk_size, len(ids)) - 1])
+        for idx in range(0, len(ids), chunk_size)
+    ]
+
+
+# ************************************************
+def invalidate_cache(env, model_name):
+    """
+    Invalidates the whole cache of an (embedded Odoo) environment
+    """
+    if hasattr(env, "invalidate_all"):
+        env.invalidate_all()
+    else:
+        # before Odoo 16, invalidates the cache of all models
+        env[model_name].invalidate_cache()
+
+
+# ************************************************
+def _run_id_range(id_range):
+    """
+    Runs in a worker process of run_in_odoo_parallel: processes the records
+    of id_range with a new cursor, committed on success. Returns (id_range,
+    None) or (id_range, formatted error)
+    """
+    script, model_name, domain, ctx = _PARALLEL_RUN
+    odoo = import_odoo()
+    try:
+        with environment_manager(odoo):
+            registry = odoo.registry(script.dbname)
+            with registry.cursor() as cur:
+                env = odoo.api.Environment(cur, odoo.SUPERUSER_ID, ctx)
+                records = env[model_name].search(
+                    domain + [("id", ">=", id_range[0]), ("id", "<=", id_range[1])],
+                    order="id",
+                )
+                script.run_chunk(records)
+        return id_range, None
+    except Exception:  # pylint: disable=broad-except
+        return id_range, traceback.format_exc()
+
+
 # ************************************************
 # Odoo Script
 
@@ -301,6 +368,38 @@ class AbstractOdooScript(
         else:
             self.logger.warning("Configuration has already been processed")
 
+    # *************************************************************************
+    def config_digest(self):
+        """
+        Digest of the config values, identifies runs of the script with
+        the same config
+        """
+        import hashlib  # pylint: disable=import-outside-toplevel
+
+        digest = hashlib.sha1()
+        if self.config is not None:
+            for section in sorted(self.config.sections()):
+                for name, value in sorted(self.config.items(section, raw=True)):
+                    digest.update("{}.{}={}\n".format(section, name, value).encode())
+        return digest.hexdigest()
+
+    # *************************************************************************
+    def get_checkpoint_store(self):
+        """
+        CheckpointStore of the script, in output_directory (current directory
+        by default), its entries are keyed by script name and config so that
+        a run with the same config resumes where the previous one stopped
+        """
+        from .checkpoint import (  # pylint: disable=import-outside-toplevel
+            CheckpointStore,
+        )
+
+        output_dir = self.get_config_value("output_directory", default=".")
+        return CheckpointStore(
+            os.path.join(output_dir, "{}_checkpoints.sqlite".format(self.name)),
+            namespace="{}:{}".format(self.name, self.config_digest()),
+        )
+
     # *************************************************************************
     def run_with_remote_odoo(self):
         """
@@ -314,56 +413,229 @@ class AbstractOdooScript(
 
         self.connection = odooconnection.Connection(self)
         self.connection.get_odoo_xmlrpc_connection()
-        self.run()
+        try:
+            self.run()
+        finally:
+            self.report_call_statistics()
 
     # *************************************************************************
-    def run_in_odoo_context(self, context=None):
+    def report_call_statistics(self):
         """
-        Execute main self script after starting an embedded Odoo Server
+        Prints statistics of the calls made to the Odoo server (unless
+        call_stats config value is 0), and exports them to output_directory
+        when call_stats_export is json or csv
+        """
+        stats = self.connection.instrumentation if self.connection else None
+        if not isinstance(stats, CallStatistics) or not stats.methods:
+            return
+        if self.get_config_value("call_stats", default="1") != "0":
+            print(stats.format_summary())  # pylint: disable=print-used
+
+        export = self.get_config_value("call_stats_export")
+        output_dir = self.get_config_value("output_directory")
+        if export in ("json", "csv") and output_dir is not None:
+            filename_ts = datetime.datetime.now().strftime("%Y-%m-%d")
+            stats.export(
+                os.path.join(
+                    output_dir,
+                    "{}_callstats_{}.{}".format(self.name, filename_ts, export),
+                )
+            )
+
+    # *************************************************************************
+    def _start_embedded_odoo(self):
+        """
+        Configures an embedded Odoo Server, returns the odoo module, None
+        if it cannot be started
         """
 
         # self.init_logs()
 
         self.odooargs = []
-        if ODOO_OK and self.config is not None:
-            self.dbname = self.get_config_value("db_name")
+        odoo = import_odoo()
+        if odoo is None or self.config is None:
+            self.logger.error("NO DB NAME given or No Odoo installation provided")
+            return None
 
-            if self.dbname is not None and ODOO_OK:
-                self.logger.info("CONNECTING TO DB : %s", self.dbname)
-            else:
-                self.logger.error(" Cannot connect to Odoo DB : %s", self.dbname)
-                return
-
-            odooargs = []
-
-            odooargs.append(
-                "-c{}".format(os.environ["ODOO_RC"])
-            )  # self.get_config_value("odoo_config")
-            odooargs.append("-d{}".format(self.dbname))
-            odooargs.append("--db_host={}".format(self.get_config_value("db_host")))
-            odooargs.append("-r{}".format(self.get_config_value("db_username")))
-            odooargs.append("-w{}".format(self.get_config_value("db_password")))
-
-            config.parse_config(self.odooargs)
-
-            odoo.cli.server.report_configuration()
-
-            with odoo.api.Environment.manage():
-                registry = odoo.registry(self.dbname)
-                odoo.modules.load_modules(registry)
-                uid = odoo.SUPERUSER_ID
-                with registry.cursor() as cur:
-                    if context is None:
-                        ctx = odoo.api.Environment(cur, uid, {})[
-                            "res.users"
-                        ].context_get()
-                    else:
-                        ctx = context
-                    env = odoo.api.Environment(cur, uid, ctx)
-                    self.run(cur, env)
+        self.dbname = self.get_config_value("db_name")
 
+        if self.dbname is not None:
+            self.logger.info("CONNECTING TO DB : %s", self.dbname)
         else:
-            self.logger.error("NO DB NAME given or No Odoo installation provided")
+            self.logger.error(" Cannot connect to Odoo DB : %s", self.dbname)
+            return None
+
+        odooargs = []
+
+        odooargs.append(
+            "-c{}".format(os.environ["ODOO_RC"])
+        )  # self.get_config_value("odoo_config")
+        odooargs.append("-d{}".format(self.dbname))
+        odooargs.append("--db_host={}".format(self.get_config_value("db_host")))
+        odooargs.append("-r{}".format(self.get_config_value("db_username")))
+        odooargs.append("-w{}".format(self.get_config_value("db_password")))
+
+        from odoo.tools import config  # pylint: disable=import-outside-toplevel
+
+        config.parse_config(self.odooargs)
+
+        odoo.cli.server.report_configuration()
+        return odoo
+
+    # *************************************************************************
+    def run_in_odoo_context(self, context=None):
+        """
+        Execute main self script after starting an embedded Odoo Server
+        """
+        odoo = self._start_embedded_odoo()
+        if odoo is None:
+            return
+
+        with environment_manager(odoo):
+            registry = odoo.registry(self.dbname)
+            odoo.modules.load_modules(registry)
+            uid = odoo.SUPERUSER_ID
+            with registry.cursor() as cur:
+                if context is None:
+                    ctx = odoo.api.Environment(cur, uid, {})["res.users"].context_get()
+                else:
+                    ctx = context
+                env = odoo.api.Environment(cur, uid, ctx)
+                self.run(cur, env)
+
+    # *************************************************************************
+    def run_in_odoo_parallel(  # pylint: disable=too-many-arguments
+        self, model_name, domain=None, workers=None, chunk_size=None, context=None
+    ):
+        """
+        Execute run_chunk(records) on the records of model_name matching
+        domain (all by default) in an embedded Odoo Server, using several
+        processes:
+        - records are split into id ranges of chunk_size records (config
+          value odoo_chunk_size, default 1000)
+        - ranges are processed by workers processes (config value
+          odoo_workers, default: number of CPUs), each range with its own
+          cursor & environment, committed once processed
+        Workers are forked (POSIX only) after the registry is loaded.
+        Returns the (first id, last id) of ranges that failed, None if Odoo
+        cannot be started
+        """
+        if type(self).run_chunk is AbstractOdooScript.run_chunk:
+            raise TypeError(
+                "{} must implement run_chunk to be run in parallel".format(
+                    type(self).__name__
+                )
+            )
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+
+        odoo = self._start_embedded_odoo()
+        if odoo is None:
+            return None
+        if workers is None:
+            workers = self.get_config_value(
+                "odoo_workers", default=os.cpu_count() or 1, datatype="int"
+            )
+        if chunk_size is None:
+            chunk_size = self.get_config_value(
+                "odoo_chunk_size", default=DEFAULT_CHUNK_SIZE, datatype="int"
+            )
+        domain = list(domain or [])
+
+        with environment_manager(odoo):
+            registry = odoo.registry(self.dbname)
+            odoo.modules.load_modules(registry)
+            with registry.cursor() as cur:
+                env = odoo.api.Environment(cur, odoo.SUPERUSER_ID, {})
+                ctx = env["res.users"].context_get() if context is None else context
+                ids = env[model_name].search(domain, order="id").ids
+        ranges = split_id_ranges(ids, chunk_size)
+        self.logger.info(
+            "Processing %d %s records in %d ranges with %d workers",
+            len(ids),
+            model_name,
+            len(ranges),
+            workers,
+        )
+
+        # forked workers must not share the database connections of the parent
+        odoo.sql_db.close_all()
+        global _PARALLEL_RUN  # pylint: disable=global-statement
+        _PARALLEL_RUN = (self, model_name, domain, ctx)
+        try:
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                results = pool.map(_run_id_range, ranges, chunksize=1)
+        finally:
+            _PARALLEL_RUN = None
+
+        failed = []
+        for id_range, error in results:
+            if error is not None:
+                self.logger.error(
+                    "Failed to process %s records %d to %d: %s",
+                    model_name,
+                    id_range[0],
+                    id_range[1],
+                    error,
+                )
+                failed.append(id_range)
+        return failed
+
+    # ************************************************************************
+    def iter_batches(self, records, batch_size=DEFAULT_CHUNK_SIZE, checkpoint=None):
+        """
+        Generator yielding records (embedded Odoo recordset) by batches of
+        batch_size records, ordered by id. Once a batch is processed, the
+        transaction is committed and the environment cache invalidated, so
+        that neither grows with the number of records.
+        If checkpoint (a CheckpointStore, or the file name of one) is given,
+        the id of the last committed record is saved in it: when the script
+        is run again after a failure, records up to that id are skipped. The
+        checkpoint is cleared once all records are processed.
+
+            for batch in self.iter_batches(env["res.partner"].search([])):
+                batch.write(...)
+        """
+        import bisect  # pylint: disable=import-outside-toplevel
+
+        from .checkpoint import (  # pylint: disable=import-outside-toplevel
+            CheckpointStore,
+        )
+
+        env = records.env
+        ids = sorted(records.ids)
+        watermark = "iter_batches:" + records._name
+        with contextlib.ExitStack() as stack:
+            if checkpoint is not None and not isinstance(checkpoint, CheckpointStore):
+                checkpoint = stack.enter_context(CheckpointStore(checkpoint))
+            last_id = (
+                None if checkpoint is None else checkpoint.get_watermark(watermark)
+            )
+            if last_id is not None:
+                self.logger.info(
+                    "Resuming %s after id %d (%s)",
+                    records._name,
+                    last_id,
+                    checkpoint.filename,
+                )
+                ids = ids[bisect.bisect_right(ids, last_id) :]
+
+            for start in range(0, len(ids), batch_size):
+                batch_ids = ids[start : start + batch_size]
+                yield records.browse(batch_ids)
+                env.cr.commit()
+                invalidate_cache(env, records._name)
+                if checkpoint is not None:
+                    checkpoint.set_watermark(watermark, batch_ids[-1])
+
+            if checkpoint is not None:
+                checkpoint.set_watermark(watermark, None)
+
+    # ************************************************************************
+    def run_chunk(self, records):
+        """
+        Processes a chunk of records, to be implemented by scripts run with
+        run_in_odoo_parallel (checked before workers are started)
+        """
 
     # ************************************************************************
     @abstractmethod
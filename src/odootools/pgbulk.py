@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Bulk access to the PostgreSQL database of Odoo, through a DB-API
+connection (see Connection.get_db_connection)
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import csv
+import io
+import itertools
+import re
+import tempfile
+from datetime import date, datetime
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+DEFAULT_BATCH_SIZE = 2000
+
+# backslash sequences of COPY text format
+COPY_TEXT_ESCAPES = {
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+COPY_TEXT_NULL = "\\N"
+COPY_TEXT_SPECIALS = {
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+}
+
+_ESCAPE_RE = re.compile(r"\\(.)")
+_SPECIALS_RE = re.compile(r"[\\\t\n\r]")
+_cursor_ids = itertools.count(1)
+
+
+# -------------------------------------------------------------------------------------
+def iter_query_batches(db_conn, query, params=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Generator yielding the rows returned by query as lists of at most
+    batch_size tuples. Rows are fetched from a server-side cursor
+    (DECLARE / FETCH), so the result set never has to fit in memory.
+    The cursor lives in the current transaction of db_conn
+    """
+    name = "odootools_cursor_{}".format(next(_cursor_ids))
+    cursor = db_conn.cursor()
+    try:
+        cursor.execute("DECLARE {} NO SCROLL CURSOR FOR {}".format(name, query), params)
+        while True:
+            cursor.execute("FETCH FORWARD {:d} FROM {}".format(batch_size, name))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            yield [tuple(row) for row in rows]
+            if len(rows) < batch_size:
+                break
+        cursor.execute("CLOSE {}".format(name))
+    finally:
+        cursor.close()
+
+
+# -------------------------------------------------------------------------------------
+def iter_query(db_conn, query, params=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Generator yielding the rows (tuples) returned by query, fetched by
+    batches of batch_size from a server-side cursor
+    """
+    for rows in iter_query_batches(db_conn, query, params, batch_size):
+        yield from rows
+
+
+# -------------------------------------------------------------------------------------
+def query_columns(db_conn, query):
+    """
+    Names of the columns returned by query
+    """
+    cursor = db_conn.cursor()
+    try:
+        cursor.execute("SELECT * FROM ({}) AS odootools_query LIMIT 0".format(query))
+        return [column[0] for column in cursor.description]
+    finally:
+        cursor.close()
+
+
+# -------------------------------------------------------------------------------------
+def _is_psycopg2(db_conn):
+    # connections borrowed from a dbpool.DbConnectionPool are wrapped
+    db_conn = getattr(db_conn, "raw_connection", db_conn)
+    return type(db_conn).__module__.startswith("psycopg2")
+
+
+# -------------------------------------------------------------------------------------
+def _copy_out(db_conn, query, stream, copy_format="text"):
+    """
+    Writes the output of COPY (query) TO STDOUT to stream (None to get a
+    generator of lines with pgdb), with PyGreSQL (pgdb) copy_to or psycopg2
+    copy_expert. Returns the cursor
+    """
+    # pgdb only accepts queries starting with "select "
+    query = "select * from ({}) as odootools_query".format(query)
+    cursor = db_conn.cursor()
+    if _is_psycopg2(db_conn):
+        cursor.copy_expert(
+            "COPY ({}) TO STDOUT WITH (FORMAT {})".format(query, copy_format), stream
+        )
+        return cursor
+    result = cursor.copy_to(stream, query, format=copy_format, decode=True)
+    return cursor if stream is not None else result
+
+
+# -------------------------------------------------------------------------------------
+def _copy_lines(db_conn, query):
+    """
+    Generator yielding the lines of COPY (query) TO STDOUT in text format
+    """
+    if _is_psycopg2(db_conn):
+        # psycopg2 can only copy to a file
+        with tempfile.TemporaryFile(mode="w+", newline="") as buffer:
+            _copy_out(db_conn, query, buffer).close()
+            buffer.seek(0)
+            yield from buffer
+    else:
+        yield from _copy_out(db_conn, query, None)
+
+
+# -------------------------------------------------------------------------------------
+def parse_copy_line(line):
+    """
+    Splits a line of COPY text format into a tuple of strings,
+    None for NULL values
+    """
+    return tuple(
+        (
+            None
+            if value == COPY_TEXT_NULL
+            else _ESCAPE_RE.sub(
+                lambda match: COPY_TEXT_ESCAPES.get(match.group(1), match.group(1)),
+                value,
+            )
+        )
+        for value in line.rstrip("\n").split("\t")
+    )
+
+
+# -------------------------------------------------------------------------------------
+def copy_rows(db_conn, query):
+    """
+    Generator yielding the rows returned by query through
+    COPY ... TO STDOUT, as tuples of strings (None for NULL)
+    """
+    for line in _copy_lines(db_conn, query):
+        yield parse_copy_line(line)
+
+
+# -------------------------------------------------------------------------------------
+def copy_to_csv(db_conn, query, output, header=True):
+    """
+    Writes the rows returned by query to output (file name or text file)
+    as CSV through COPY ... TO STDOUT, returns the number of rows written
+    """
+    if isinstance(output, str):
+        with open(output, "w", newline="") as afile:
+            return copy_to_csv(db_conn, query, afile, header)
+
+    if header:
+        csv.writer(output, lineterminator="\n").writerow(query_columns(db_conn, query))
+    cursor = _copy_out(db_conn, query, output, "csv")
+    count = cursor.rowcount
+    cursor.close()
+    return count
+
+
+# -------------------------------------------------------------------------------------
+def quote_identifier(name):
+    """
+    Quotes a table or column name for SQL
+    """
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+# -------------------------------------------------------------------------------------
+def format_copy_value(value):
+    """
+    Formats a python value as a field of COPY text format
+    """
+    if value is None:
+        return COPY_TEXT_NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return _SPECIALS_RE.sub(
+        lambda match: COPY_TEXT_SPECIALS[match.group(0)], str(value)
+    )
+
+
+# -------------------------------------------------------------------------------------
+class _LinesReader(io.TextIOBase):
+    """
+    Read-only text file over an iterable of lines, lets drivers pull
+    COPY input without the whole data being built in memory
+    """
+
+    def __init__(self, lines):
+        super().__init__()
+        self._lines = iter(lines)
+        self._buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size is None or size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+# -------------------------------------------------------------------------------------
+def _copy_in(db_conn, table, stream, columns=None, copy_format="text"):
+    """
+    Runs COPY table FROM STDIN reading stream (a text file), with PyGreSQL
+    (pgdb) copy_from or psycopg2 copy_expert. Returns the number of rows
+    """
+    cursor = db_conn.cursor()
+    try:
+        if _is_psycopg2(db_conn):
+            cursor.copy_expert(
+                "COPY {}{} FROM STDIN WITH (FORMAT {})".format(
+                    quote_identifier(table),
+                    (
+                        " ({})".format(", ".join(map(quote_identifier, columns)))
+                        if columns
+                        else ""
+                    ),
+                    copy_format,
+                ),
+                stream,
+            )
+        else:
+            cursor.copy_from(stream, table, format=copy_format, columns=columns)
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+# -------------------------------------------------------------------------------------
+def copy_from_rows(db_conn, table, rows, columns=None):
+    """
+    Streams rows (sequences of python values) into table through
+    COPY ... FROM STDIN, returns the number of rows
+    """
+    lines = (
+        "\t".join(format_copy_value(value) for value in row) + "\n" for row in rows
+    )
+    return _copy_in(db_conn, table, _LinesReader(lines), columns)
+
+
+# -------------------------------------------------------------------------------------
+def copy_from_csv(db_conn, table, source, columns=None, header=True):
+    """
+    Streams a CSV file (file name or text file) into table through
+    COPY ... FROM STDIN, returns the number of rows
+    """
+    if isinstance(source, str):
+        with open(source, "r", newline="") as afile:
+            return copy_from_csv(db_conn, table, afile, columns, header)
+    if header:
+        source.readline()
+    return _copy_in(db_conn, table, source, columns, "csv")
+
+
+# -------------------------------------------------------------------------------------
+class StagingLoader:
+    """
+    Loads large volumes of data into Odoo tables directly in PostgreSQL:
+
+    - rows or CSV files are streamed into an UNLOGGED staging table
+      through COPY ... FROM STDIN
+    - target tables are then filled with set-based SQL statements
+      reading the staging table (named {staging} in statements)
+    - a public method of the Odoo model is called on the records
+      created/updated that way, for Odoo to recompute what depends on them
+
+        with connection.staging_loader(
+            "partner_import", [("ref", "varchar"), ("name", "varchar")]
+        ) as loader:
+            loader.load_rows(rows)
+            loader.fill(
+                "INSERT INTO res_partner (ref, name, active, create_date, write_date)"
+                " SELECT s.ref, s.name, true, now(), now() FROM {staging} s"
+            )
+            loader.recompute(
+                "res.partner", "my_recompute_method",
+                query="SELECT p.id FROM res_partner p JOIN {staging} s USING (ref)",
+            )
+
+    Each step is committed, the staging table is dropped on exit unless
+    keep is True
+    """
+
+    def __init__(self, connection, table, columns, keep=False):
+        self.connection = connection
+        self.table = table
+        self.columns = list(columns)
+        self.keep = keep
+        self.db_conn = None
+        self.loaded = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # *************************************************************
+    def _execute(self, sql, params=None):
+        cursor = self.db_conn.cursor()
+        try:
+            cursor.execute(
+                sql.replace("{staging}", quote_identifier(self.table)), params
+            )
+            rows = cursor.fetchall() if cursor.description else None
+            return cursor.rowcount, rows
+        finally:
+            cursor.close()
+
+    # *************************************************************
+    def open(self):
+        """
+        (Re)creates the staging table
+        """
+        self.db_conn = self.connection.get_db_connection()
+        if self.db_conn is None:
+            raise ConnectionError("Not Connected to Postgresql Database")
+        self._execute("DROP TABLE IF EXISTS {staging}")
+        self._execute(
+            "CREATE UNLOGGED TABLE {staging} ("
+            + ", ".join(
+                "{} {}".format(quote_identifier(name), sql_type)
+                for name, sql_type in self.columns
+            )
+            + ")"
+        )
+        self.db_conn.commit()
+
+    # *************************************************************
+    def close(self):
+        """
+        Drops the staging table (unless kept) and gives the connection back
+        """
+        if self.db_conn is None:
+            return
+        try:
+            self.db_conn.rollback()
+            if not self.keep:
+                self._execute("DROP TABLE IF EXISTS {staging}")
+                self.db_conn.commit()
+        finally:
+            self.db_conn.close()
+            self.db_conn = None
+
+    # *************************************************************
+    def load_rows(self, rows):
+        """
+        Streams rows (sequences of values, in the order of columns) into
+        the staging table, returns the number of rows loaded
+        """
+        count = copy_from_rows(
+            self.db_conn, self.table, rows, [name for name, _type in self.columns]
+        )
+        self.db_conn.commit()
+        self.loaded += count
+        return count
+
+    # *************************************************************
+    def load_csv(self, source, header=True):
+        """
+        Streams a CSV file (file name or text file), with columns in the
+        order of the staging table, returns the number of rows loaded
+        """
+        count = copy_from_csv(
+            self.db_conn,
+            self.table,
+            source,
+            [name for name, _type in self.columns],
+            header,
+        )
+        self.db_conn.commit()
+        self.loaded += count
+        return count
+
+    # *************************************************************
+    def fill(self, sql, params=None):
+        """
+        Runs a set-based SQL statement, {staging} being replaced by the
+        staging table, returns the number of rows affected
+        """
+        count, _rows = self._execute(sql, params)
+        self.db_conn.commit()
+        return count
+
+    # *************************************************************
+    def select_ids(self, sql, params=None):
+        """
+        Ids returned by an SQL query ({staging} being replaced by the
+        staging table)
+        """
+        _count, rows = self._execute(sql, params)
+        return [row[0] for row in rows or ()]
+
+    # *************************************************************
+    def recompute(  # pylint: disable=too-many-arguments
+        self,
+        model_name,
+        method_name,
+        ids=None,
+        query=None,
+        args=(),
+        chunk_size=1000,
+        workers=1,
+    ):
+        """
+        Calls method_name (through XML-RPC) on the records of model_name
+        given as ids or selected by query, by chunks of chunk_size ids.
+        The method must return a value (e.g. True), ids of chunks for which
+        it failed (or returned None) are returned
+        """
+        if ids is None:
+            ids = self.select_ids(query)
+        ids = list(ids)
+        chunks = [ids[idx : idx + chunk_size] for idx in range(0, len(ids), chunk_size)]
+        results = self.connection.parallel_execute(
+            model_name, method_name, chunks, workers=workers, args=args
+        )
+        if results is None:
+            return ids
+        failed = []
+        for chunk, result in zip(chunks, results):
+            if result is None:
+                failed.extend(chunk)
+        return failed
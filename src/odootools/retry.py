@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Retry policy and circuit breaker for calls made to a distant Odoo server
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import random
+import socket
+import threading
+import time
+import xmlrpc.client as xmlrpclib
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+# transient error classes, also used as keys of the [retry] config section
+PROTOCOL_ERROR = "protocol_error"
+CONNECTION_ERROR = "connection_error"
+TIMEOUT = "timeout"
+SERIALIZATION_FAILURE = "serialization_failure"
+
+# default number of retries for each error class
+DEFAULT_RETRIES = {
+    PROTOCOL_ERROR: 3,
+    CONNECTION_ERROR: 3,
+    TIMEOUT: 1,
+    SERIALIZATION_FAILURE: 3,
+}
+
+# HTTP statuses returned by proxies in front of busy/restarting Odoo workers
+TRANSIENT_HTTP_STATUSES = (502, 503, 504)
+
+SERIALIZATION_MESSAGES = (
+    "could not serialize access",
+    "SerializationFailure",
+    "TransactionRollbackError",
+    "concurrent update",
+)
+
+# calls that can safely be sent again, others are only retried when the
+# server refused the connection (i.e. the call was never received) or
+# rolled the transaction back (serialization failure)
+IDEMPOTENT_METHODS = (
+    "search",
+    "search_read",
+    "search_count",
+    "read",
+    "read_group",
+    "name_search",
+    "name_get",
+    "fields_get",
+    "default_get",
+)
+
+
+# -------------------------------------------------------------------------------------
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of calling a server that keeps failing
+    """
+
+
+# -------------------------------------------------------------------------------------
+def classify_error(err):
+    """
+    Returns the transient error class of err, None if it is not transient
+    """
+    if isinstance(err, xmlrpclib.ProtocolError):
+        if err.errcode in TRANSIENT_HTTP_STATUSES:
+            return PROTOCOL_ERROR
+        return None
+    if isinstance(err, xmlrpclib.Fault):
+        message = str(err.faultString)
+        if any(text in message for text in SERIALIZATION_MESSAGES):
+            return SERIALIZATION_FAILURE
+        return None
+    if isinstance(err, CircuitOpenError):
+        return None
+    if isinstance(err, socket.timeout):
+        return TIMEOUT
+    if isinstance(err, ConnectionError):
+        return CONNECTION_ERROR
+    return None
+
+
+# -------------------------------------------------------------------------------------
+class RetryPolicy:
+    """
+    Number of retries per transient error class, with exponential backoff
+    (full jitter) between attempts
+    """
+
+    def __init__(self, retries=None, backoff=0.5, max_backoff=30.0):
+        self.retries = dict(DEFAULT_RETRIES)
+        self.retries.update(retries or {})
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    @classmethod
+    def from_config(cls, context):
+        """
+        Reads the policy from the [retry] config section, e.g.:
+
+            [retry]
+            protocol_error = 5
+            timeout = 0
+            backoff = 1.0
+        """
+        retries = {}
+        for kind, default in DEFAULT_RETRIES.items():
+            retries[kind] = context.get_config_value(
+                kind, default=default, section="retry", datatype="int"
+            )
+        return cls(
+            retries=retries,
+            backoff=context.get_config_value(
+                "backoff", default=0.5, section="retry", datatype="float"
+            ),
+            max_backoff=context.get_config_value(
+                "max_backoff", default=30.0, section="retry", datatype="float"
+            ),
+        )
+
+    def should_retry(self, err, method_name, attempt):
+        """
+        Whether a call that failed attempt + 1 times with err is sent again
+        """
+        kind = classify_error(err)
+        if kind is None or attempt >= self.retries.get(kind, 0):
+            return False
+        return (
+            kind == SERIALIZATION_FAILURE
+            or method_name in IDEMPOTENT_METHODS
+            or isinstance(err, ConnectionRefusedError)
+        )
+
+    def delay(self, attempt):
+        """
+        Seconds to wait before sending attempt (0 based) again
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+# -------------------------------------------------------------------------------------
+class CircuitBreaker:
+    """
+    Opens after threshold consecutive transient failures, calls then fail
+    fast with CircuitOpenError for cooldown seconds, after which a single
+    trial call is let through: its success closes the circuit again
+    """
+
+    def __init__(self, threshold=5, cooldown=30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, context):
+        """
+        Reads breaker_threshold & breaker_cooldown from the [retry] section
+        """
+        return cls(
+            threshold=context.get_config_value(
+                "breaker_threshold", default=5, section="retry", datatype="int"
+            ),
+            cooldown=context.get_config_value(
+                "breaker_cooldown", default=30.0, section="retry", datatype="float"
+            ),
+        )
+
+    def before_call(self):
+        """
+        Raises CircuitOpenError if the server should not be called, returns
+        True if the call is the trial one (see end_trial)
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if self._trial or time.monotonic() - self.opened_at < self.cooldown:
+                raise CircuitOpenError(
+                    "Odoo server keeps failing, calls suspended for {}s".format(
+                        self.cooldown
+                    )
+                )
+            self._trial = True
+            return True
+
+    def end_trial(self):
+        """
+        Trial call is over: if neither its success nor its failure was
+        recorded (non transient error), the next call is a new trial
+        """
+        with self._lock:
+            self._trial = False
+
+    def record_success(self):
+        """
+        Server answered (even with a non transient error)
+        """
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        """
+        Server failed with a transient error
+        """
+        with self._lock:
+            self.failures += 1
+            if self._trial or (self.threshold and self.failures >= self.threshold):
+                self.opened_at = time.monotonic()
+            self._trial = False
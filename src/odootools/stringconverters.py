@@ -12,6 +12,7 @@ Utility functions to convert data
 """
 
 from datetime import date, timedelta, datetime
+from functools import singledispatch
 
 # -------------------------------------------------------------------------------------
 # CONSTANTS
@@ -19,21 +20,85 @@ from datetime import date, timedelta, datetime
 XLS_DATE_REF = date(1900, 1, 1)
 
 
+# -------------------------------------------------------------------------------------
+def _no_converter(value):
+    raise TypeError("No converter registered for {}".format(type(value)))
+
+
+# -------------------------------------------------------------------------------------
+def resolve_converter(registry, cache, cls):
+    """
+    Converter registered for the closest class of cls, chosen as
+    functools.singledispatch does (abstract base classes such as
+    collections.abc.Mapping included), cached for cls
+    """
+    dispatcher = singledispatch(_no_converter)
+    for klass, klass_converter in registry.items():
+        dispatcher.register(klass, klass_converter)
+    converter = dispatcher.dispatch(cls)
+    if converter is _no_converter:
+        raise TypeError("No converter registered for {}".format(cls))
+    cache[cls] = converter
+    return converter
+
+
+# -------------------------------------------------------------------------------------
+def _str_to_string(value):
+    return value
+
+
+def _exception_to_string(value):
+    return str(type(value)) + " -- " + str(value)
+
+
+# type -> function(value) returning a string, see register_to_string
+TO_STRING_CONVERTERS = {
+    object: str,
+    str: _str_to_string,
+    Exception: _exception_to_string,
+}
+_to_string_cache = {}
+
+
+# -------------------------------------------------------------------------------------
+def register_to_string(cls, converter=None):
+    """
+    Registers converter(value) as the to_string conversion of cls (and its
+    subclasses), can be used as a decorator:
+
+        @register_to_string(Decimal)
+        def decimal_to_string(value):
+            ...
+    """
+    if converter is None:
+        return lambda func: register_to_string(cls, func)
+    TO_STRING_CONVERTERS[cls] = converter
+    _to_string_cache.clear()
+    return converter
+
+
+# -------------------------------------------------------------------------------------
+def unregister_to_string(cls):
+    """
+    Removes the to_string conversion registered for cls
+    """
+    TO_STRING_CONVERTERS.pop(cls, None)
+    _to_string_cache.clear()
+
+
 # -------------------------------------------------------------------------------------
 def to_string(value):
     """
-    Utility: Transfo des chaines en unicode
+    Utility: Transfo des chaines en unicode, conversion chosen on the type of
+    value (see register_to_string)
     """
-    avalue = ""
-    if isinstance(value, str):
-        avalue = value
-    elif isinstance(value, Exception):
-        avalue = str(type(value)) + " -- " + str(value)
-    elif isinstance(value, object):
-        avalue = str(value)
-    else:
-        avalue = str(value)
-    return avalue
+    cls = type(value)
+    if cls is str:
+        return value
+    converter = _to_string_cache.get(cls)
+    if converter is None:
+        converter = resolve_converter(TO_STRING_CONVERTERS, _to_string_cache, cls)
+    return converter(value)
 
 
 # -------------------------------------------------------------------------------------
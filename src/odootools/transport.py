@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+HTTP transports used to talk to a distant Odoo server
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import base64
+import gzip
+import http.client
+import itertools
+import json
+import time
+import xmlrpc.client as xmlrpclib
+from datetime import date, datetime
+from urllib.parse import urlsplit
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+# errors raised when reusing a connection the server has already closed
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+DEFAULT_MAX_IDLE = 30.0
+
+PROTOCOL_XMLRPC = "xmlrpc"
+PROTOCOL_JSONRPC = "jsonrpc"
+
+
+# -------------------------------------------------------------------------------------
+class KeepAliveMixin:
+    """
+    Keeps the HTTP connection of an xmlrpc Transport alive between requests
+
+    - timeout: socket timeout (seconds) of the connection, None for default
+    - max_idle: a connection unused for more than max_idle seconds is
+      re-opened instead of being reused, None to always reuse it
+    - retries: number of times a request is re-sent on a fresh connection
+      when the server has closed the reused one
+
+    Sizes (bytes) of the last request & response are kept in
+    last_request_size & last_response_size
+    """
+
+    # class of the kept-alive connection
+    connection_class = http.client.HTTPConnection
+
+    def __init__(
+        self, *args, timeout=None, max_idle=DEFAULT_MAX_IDLE, retries=1, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.retries = retries
+        self.last_used = None
+        self.reused = False
+        self.last_request_size = 0
+        self.last_response_size = 0
+
+    def make_connection(self, host):
+        if (
+            self._connection[1] is not None
+            and self.max_idle is not None
+            and self.last_used is not None
+            and time.monotonic() - self.last_used > self.max_idle
+        ):
+            self.close()
+
+        if self._connection and host == self._connection[0]:
+            self.reused = True
+            return self._connection[1]
+
+        self.close()
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        kwargs = {"timeout": self.timeout}
+        if isinstance(self, xmlrpclib.SafeTransport):
+            kwargs.update(x509 or {}, context=self.context)
+        self._connection = host, self.connection_class(chost, **kwargs)
+        self.reused = False
+        return self._connection[1]
+
+    def request(self, host, handler, request_body, verbose=False):
+        self.last_request_size = len(request_body)
+        self.last_response_size = 0
+        attempt = 0
+        while True:
+            try:
+                result = self.single_request(host, handler, request_body, verbose)
+                self.last_used = time.monotonic()
+                return result
+            except STALE_CONNECTION_ERRORS:
+                self.close()
+                # only a reused connection may have been closed while idle,
+                # the request did not reach the server then
+                if not self.reused or attempt >= self.retries:
+                    raise
+                attempt += 1
+
+    def read_body(self, response):
+        """
+        reads the whole (decompressed) body of response
+        """
+        body = response.read()
+        self.last_response_size = len(body)
+        if response.getheader("Content-Encoding", "") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def parse_response(self, response):
+        body = self.read_body(response)
+        parser, unmarshaller = self.getparser()
+        parser.feed(body)
+        parser.close()
+        return unmarshaller.close()
+
+
+# -------------------------------------------------------------------------------------
+class KeepAliveTransport(KeepAliveMixin, xmlrpclib.Transport):
+    """
+    Keep-alive transport for http:// urls
+    """
+
+
+# -------------------------------------------------------------------------------------
+class SafeKeepAliveTransport(KeepAliveMixin, xmlrpclib.SafeTransport):
+    """
+    Keep-alive transport for https:// urls, saves TLS handshakes
+    """
+
+    connection_class = http.client.HTTPSConnection
+
+
+# -------------------------------------------------------------------------------------
+def _json_default(value):
+    """
+    encodes values xmlrpc can marshall but json cannot
+    """
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, xmlrpclib.Binary):
+        value = value.data
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, xmlrpclib.DateTime):
+        return datetime.strptime(value.value, "%Y%m%dT%H:%M:%S").strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+    raise TypeError("Cannot encode {} to JSON".format(type(value)))
+
+
+# -------------------------------------------------------------------------------------
+class JsonRpcMixin:
+    """
+    Turns a keep-alive xmlrpc Transport into a transport for Odoo /jsonrpc
+    route, errors returned by Odoo are raised as xmlrpc Fault so that callers
+    handle them the same way for both protocols
+    """
+
+    def send_request(self, host, handler, request_body, debug):
+        connection = self.make_connection(host)
+        headers = self._headers + self._extra_headers
+        if debug:
+            connection.set_debuglevel(1)
+        connection.putrequest("POST", handler)
+        headers.append(("Content-Type", "application/json"))
+        headers.append(("User-Agent", self.user_agent))
+        self.send_headers(connection, headers)
+        self.send_content(connection, request_body)
+        return connection
+
+    def parse_response(self, response):
+        answer = json.loads(self.read_body(response))
+        error = answer.get("error")
+        if error:
+            data = error.get("data") or {}
+            raise xmlrpclib.Fault(
+                error.get("code", 1),
+                data.get("debug") or data.get("message") or error.get("message"),
+            )
+        return answer.get("result")
+
+
+# -------------------------------------------------------------------------------------
+class JsonRpcTransport(JsonRpcMixin, KeepAliveTransport):
+    """
+    Keep-alive JSON-RPC transport for http:// urls
+    """
+
+
+# -------------------------------------------------------------------------------------
+class SafeJsonRpcTransport(JsonRpcMixin, SafeKeepAliveTransport):
+    """
+    Keep-alive JSON-RPC transport for https:// urls
+    """
+
+
+# -------------------------------------------------------------------------------------
+class JsonRpcServerProxy:
+    """
+    Calls methods of an Odoo service (db, common, object) through the
+    /jsonrpc route, with the same surface as an xmlrpc ServerProxy:
+
+        JsonRpcServerProxy(url, "object", transport).execute_kw(...)
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, url, service, transport):
+        self._host = urlsplit(url).netloc
+        self._service = service
+        self._transport = transport
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def method(*args):
+            return self._call(name, args)
+
+        return method
+
+    def __call__(self, attr):
+        # same as ServerProxy: proxy("close")() & proxy("transport")
+        if attr == "close":
+            return self._transport.close
+        if attr == "transport":
+            return self._transport
+        raise AttributeError("Attribute {} not found".format(attr))
+
+    def _call(self, method, args):
+        payload = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": self._service, "method": method, "args": args},
+                "id": next(self._ids),
+            },
+            default=_json_default,
+        ).encode()
+        return self._transport.request(self._host, "/jsonrpc", payload)
+
+
+# -------------------------------------------------------------------------------------
+def get_keepalive_transport(
+    url, timeout=None, max_idle=DEFAULT_MAX_IDLE, retries=1, protocol=PROTOCOL_XMLRPC
+):
+    """
+    Builds the keep-alive transport matching url scheme and protocol
+    """
+    secure = url.startswith("https://")
+    if protocol == PROTOCOL_JSONRPC:
+        klass = SafeJsonRpcTransport if secure else JsonRpcTransport
+    else:
+        klass = SafeKeepAliveTransport if secure else KeepAliveTransport
+    return klass(timeout=timeout, max_idle=max_idle, retries=retries)
+
+
+# -------------------------------------------------------------------------------------
+def get_server_proxy(url, endpoint, transport, protocol=PROTOCOL_XMLRPC):
+    """
+    Builds a proxy to an xmlrpc endpoint (e.g. xmlrpc/2/object) of the
+    Odoo server, or to the matching service through JSON-RPC
+    """
+    if protocol == PROTOCOL_JSONRPC:
+        return JsonRpcServerProxy(url, endpoint.rsplit("/", 1)[-1], transport)
+    return xmlrpclib.ServerProxy(
+        "{}/{}".format(url, endpoint), transport=transport, allow_none=True
+    )
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Micro-benchmark of stringconverters.to_string on a mixed-type column,
+type dispatched version vs the former isinstance chain
+
+    PYTHONPATH=src python tests/benchmarks/bench_converters.py [values]
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+from datetime import date, datetime
+import sys
+import timeit
+
+from odootools.stringconverters import to_string
+
+
+# -------------------------------------------------------------------------------------
+def legacy_to_string(value):
+    """
+    to_string before type dispatch
+    """
+    avalue = ""
+    if isinstance(value, str):
+        avalue = value
+    elif isinstance(value, Exception):
+        avalue = str(type(value)) + " -- " + str(value)
+    elif isinstance(value, object):
+        avalue = str(value)
+    else:
+        avalue = str(value)
+    return avalue
+
+
+# -------------------------------------------------------------------------------------
+def build_column(count):
+    """
+    values found in imported spreadsheets & error logs
+    """
+    samples = (
+        "Partner",
+        42,
+        3.14,
+        None,
+        True,
+        date(2026, 10, 18),
+        datetime(2026, 10, 18, 12, 0),
+        ValueError("bad value"),
+    )
+    return [samples[idx % len(samples)] for idx in range(count)]
+
+
+# -------------------------------------------------------------------------------------
+def main(count):
+    """
+    prints per-call timings of both versions
+    """
+    column = build_column(count)
+    print("{} values".format(count))  # pylint: disable=print-used
+    for name, func in (("legacy", legacy_to_string), ("dispatch", to_string)):
+        timing = min(
+            timeit.repeat(lambda: [func(val) for val in column], number=1, repeat=5)
+        )
+        print(  # pylint: disable=print-used
+            "{:8s} {:8.1f} ms {:8.1f} ns/call".format(
+                name, timing * 1000, timing * 1e9 / count
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Startup budget of a remote-only (XML-RPC) script: measures the import of
+odootools.odooscript with python -X importtime, fails if it takes more
+than budget ms or loads a heavy module (odoo, database drivers, numpy)
+
+    PYTHONPATH=src python tests/benchmarks/bench_importtime.py [budget_ms]
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import subprocess
+import sys
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+REMOTE_SCRIPT_IMPORTS = "import odootools.odooscript, odootools.odooconnection"
+HEAVY_MODULES = ("odoo", "pgdb", "pg", "psycopg2", "numpy")
+
+
+# -------------------------------------------------------------------------------------
+def measure_imports():
+    """
+    (module, cumulative µs, nested) of every module imported by a
+    remote-only script, nested is True for modules imported by another one
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", REMOTE_SCRIPT_IMPORTS],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_time, cumulative, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(cumulative), name.startswith("  ")))
+    return modules
+
+
+# -------------------------------------------------------------------------------------
+def main(budget):
+    """
+    prints the slowest imports, returns 1 if the budget is exceeded
+    """
+    modules = measure_imports()
+    total = sum(
+        cumulative / 1000
+        for name, cumulative, nested in modules
+        if not nested and name.split(".")[0] == "odootools"
+    )
+    heavy = sorted(
+        name
+        for name, _cumulative, _nested in modules
+        if name.split(".")[0] in HEAVY_MODULES
+    )
+    for name, cumulative, _nested in sorted(modules, key=lambda mod: -mod[1])[:15]:
+        print(  # pylint: disable=print-used
+            "{:50s} {:8.1f} ms".format(name, cumulative / 1000)
+        )
+    print(  # pylint: disable=print-used
+        "total {:.1f} ms (budget {:.1f} ms), heavy modules: {}".format(
+            total, budget, ", ".join(heavy) or "none"
+        )
+    )
+    return 1 if total > budget or heavy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 250.0))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Micro-benchmark of XML-RPC vs JSON-RPC serialisation of a 10k records
+read (what both client & server pay for each search_read)
+
+    python tests/benchmarks/bench_transports.py [records]
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import json
+import sys
+import timeit
+import xmlrpc.client as xmlrpclib
+
+
+# -------------------------------------------------------------------------------------
+def build_records(count):
+    """
+    res.partner like records
+    """
+    return [
+        {
+            "id": idx,
+            "name": "Partner {}".format(idx),
+            "ref": "REF{:06d}".format(idx),
+            "email": "partner{}@example.com".format(idx),
+            "active": True,
+            "credit_limit": idx * 1.5,
+            "country_id": [75, "France"],
+            "category_id": [1, 2, 3],
+            "write_date": "2026-10-18 12:00:00",
+        }
+        for idx in range(count)
+    ]
+
+
+# -------------------------------------------------------------------------------------
+def xmlrpc_roundtrip(records):
+    """
+    server side dumps, client side loads
+    """
+    payload = xmlrpclib.dumps((records,), methodresponse=True, allow_none=True)
+    xmlrpclib.loads(payload)
+    return payload
+
+
+# -------------------------------------------------------------------------------------
+def jsonrpc_roundtrip(records):
+    """
+    server side dumps, client side loads
+    """
+    payload = json.dumps({"jsonrpc": "2.0", "id": 1, "result": records})
+    json.loads(payload)
+    return payload
+
+
+# -------------------------------------------------------------------------------------
+def main(count):
+    """
+    prints timings & payload sizes for both protocols
+    """
+    records = build_records(count)
+    print("{} records".format(count))  # pylint: disable=print-used
+    for name, func in (("xmlrpc", xmlrpc_roundtrip), ("jsonrpc", jsonrpc_roundtrip)):
+        size = len(func(records).encode())
+        timing = min(timeit.repeat(lambda: func(records), number=1, repeat=5))
+        print(  # pylint: disable=print-used
+            "{:8s} {:8.1f} ms {:10d} bytes".format(name, timing * 1000, size)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
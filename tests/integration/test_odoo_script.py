@@ -9,8 +9,15 @@ Created on April 2023
 @license: L-GPL
 """
 
+import os
+import tempfile
 
-from odootools.odooscript import AbstractOdooScript
+from odootools.checkpoint import CheckpointStore
+from odootools.odooscript import AbstractOdooScript, import_odoo
+
+PARALLEL_RECORDS = 30
+PARALLEL_FAILING = 25
+BATCH_RECORDS = 25
 
 
 class TestScript(AbstractOdooScript):
@@ -20,6 +27,13 @@ class TestScript(AbstractOdooScript):
     def run(self, cur, env):
         self.test_extra_param()
         self.test_odoo_env(env)
+        self.test_iter_batches(env)
+        self.create_parallel_records(env)
+
+    def run_chunk(self, records):
+        if "parallel FAIL" in records.mapped("name"):
+            raise Exception("Failing range")
+        records.write({"ref": "PARALLEL"})
 
     def test_extra_param(self):
         extra_param = self.get_option("-e", "--extra")
@@ -34,7 +48,85 @@ class TestScript(AbstractOdooScript):
         if name != "System":
             raise Exception(f"Expected : 'System', received : '{name}'")
 
+    def test_iter_batches(self, env):
+        partners = env["res.partner"].create(
+            [{"name": f"batch {idx}"} for idx in range(BATCH_RECORDS)]
+        )
+        env.cr.commit()
+        first_id = partners.ids[0]
+        checkpoint = os.path.join(tempfile.mkdtemp(), "checkpoints.sqlite")
+
+        # interrupted run: the first batch is committed, the second one not
+        try:
+            for batch in self.iter_batches(partners, 10, checkpoint=checkpoint):
+                if first_id in batch.ids:
+                    batch.mapped("name")
+                    env.cr.execute(
+                        "UPDATE res_partner SET name = 'renamed' WHERE id = %s",
+                        [first_id],
+                    )
+                    batch.write({"ref": "BATCH"})
+                    continue
+                name = env["res.partner"].browse(first_id).name
+                if name != "renamed":
+                    raise Exception(f"Cache not invalidated, received : '{name}'")
+                batch.write({"ref": "BATCH"})
+                raise RuntimeError("Interrupted")
+        except RuntimeError:
+            env.cr.rollback()
+        env.cr.execute(
+            "SELECT id FROM res_partner WHERE ref = 'BATCH' AND id IN %s ORDER BY id",
+            [tuple(partners.ids)],
+        )
+        committed = [row[0] for row in env.cr.fetchall()]
+        if committed != partners.ids[:10]:
+            raise Exception(f"Expected first batch committed, received : {committed}")
+
+        # resumed run: starts after the first batch, checkpoint cleared at the end
+        resumed = [
+            batch.ids
+            for batch in self.iter_batches(partners, 10, checkpoint=checkpoint)
+        ]
+        if resumed != [partners.ids[10:20], partners.ids[20:]]:
+            raise Exception(f"Expected resumed batches, received : {resumed}")
+        with CheckpointStore(checkpoint) as store:
+            if store.get_watermark("iter_batches:res.partner") is not None:
+                raise Exception("Checkpoint not cleared")
+        partners.unlink()
+
+    def create_parallel_records(self, env):
+        env["res.partner"].create(
+            [
+                {
+                    "name": (
+                        "parallel FAIL"
+                        if idx == PARALLEL_FAILING
+                        else f"parallel {idx}"
+                    )
+                }
+                for idx in range(PARALLEL_RECORDS)
+            ]
+        )
+
+    def test_parallel(self):
+        domain = [("name", "=like", "parallel %")]
+        failed = self.run_in_odoo_parallel(
+            "res.partner", domain, workers=2, chunk_size=10
+        )
+        odoo = import_odoo()
+        with odoo.registry(self.dbname).cursor() as cur:
+            env = odoo.api.Environment(cur, odoo.SUPERUSER_ID, {})
+            partners = env["res.partner"].search(domain, order="id")
+            expected_failed = [(partners.ids[20], partners.ids[-1])]
+            if failed != expected_failed:
+                raise Exception(f"Expected : {expected_failed}, received : {failed}")
+            written = partners.filtered(lambda partner: partner.ref == "PARALLEL")
+            if written.ids != partners.ids[:20]:
+                raise Exception(f"Ranges not committed, written : {written.ids}")
+            partners.unlink()
+
 
 if __name__ == "__main__":
     TEST_SCRIPT = TestScript()
     TEST_SCRIPT.run_in_odoo_context()
+    TEST_SCRIPT.test_parallel()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test bulk reads from the PostgreSQL database of Odoo
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import io
+from os.path import sep
+import sys
+import unittest
+
+from odootools import odooconnection
+from ..scripts.a_sample_script import SampleScript
+
+
+class TestPgBulk(unittest.TestCase):
+    """
+    Bulk PostgreSQL reads Test
+    """
+
+    def setUp(self):
+        """Test Init"""
+        super(TestPgBulk, self).setUp()
+        sys.argv = ["testing"]
+        self.inner_script = SampleScript()
+        self.inner_script.parse_config(
+            configfile="tests%setc%stestScript.config" % (sep, sep)
+        )
+        self.connection = odooconnection.Connection(self.inner_script)
+        with self.connection.db_session() as db_conn:
+            cursor = db_conn.cursor()
+            cursor.execute("SELECT count(*) FROM res_partner")
+            self.partner_count = cursor.fetchone()[0]
+            cursor.close()
+
+    def test_iter_query(self):
+        """
+        Test reads through a server-side cursor
+        """
+        rows = list(
+            self.connection.db_iter_query(
+                "SELECT id, name FROM res_partner ORDER BY id", batch_size=3
+            )
+        )
+        self.assertEqual(len(rows), self.partner_count)
+        self.assertEqual(len(rows[0]), 2)
+
+    def test_copy(self):
+        """
+        Test reads through COPY TO STDOUT
+        """
+        rows = list(self.connection.db_copy_rows("SELECT id, name FROM res_partner"))
+        self.assertEqual(len(rows), self.partner_count)
+
+        output = io.StringIO()
+        count = self.connection.db_copy_to_csv(
+            "SELECT id, name FROM res_partner", output
+        )
+        self.assertEqual(count, self.partner_count)
+        self.assertTrue(output.getvalue().startswith("id,name\n"))
+
+    def test_staging_loader(self):
+        """
+        Test loads through COPY FROM STDIN into a staging table
+        """
+        rows = [(idx, "name {}".format(idx)) for idx in range(1, 1001)]
+        with self.connection.staging_loader(
+            "odootools_test_staging", [("id", "integer"), ("name", "varchar")]
+        ) as loader:
+            self.assertEqual(loader.load_rows(rows), 1000)
+            self.assertEqual(loader.load_csv(io.StringIO("id,name\n1001,last\n")), 1)
+            self.assertEqual(
+                loader.fill("UPDATE {staging} SET name = upper(name) WHERE id > 500"),
+                501,
+            )
+            self.assertEqual(
+                loader.select_ids("SELECT id FROM {staging} WHERE name = 'LAST'"),
+                [1001],
+            )
+            # literals with braces are left untouched
+            self.assertEqual(
+                loader.fill(
+                    "UPDATE {staging} SET name = array_to_string('{a,b}'::text[], ',')"
+                    " WHERE id = 1"
+                ),
+                1,
+            )
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test asyncio Odoo Connection against a local stand-in XML-RPC server
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import asyncio
+from os.path import sep
+import sys
+import unittest
+
+from odootools.asyncconnection import AsyncConnection
+
+from ..scripts.a_sample_script import SampleScript
+from ..scripts.fake_odoo_server import FakeOdooServer
+
+
+class TestAsyncConn(unittest.TestCase):
+    """
+    asyncio Odoo Connection Test
+    """
+
+    def setUp(self):
+        """Test Init"""
+        super(TestAsyncConn, self).setUp()
+        self.server = FakeOdooServer().start()
+        self.addCleanup(self.server.stop)
+        self.store = self.server.store
+
+        sys.argv = ["testing"]
+        self.inner_script = SampleScript()
+        self.inner_script.parse_config(
+            configfile="tests{asep}etc{asep}testScript.config".format(asep=sep)
+        )
+        self.inner_script.config.set("options", "odoo_port", str(self.server.port))
+
+    def test_concurrent_reads(self):
+        """
+        Test many concurrent reads over a bounded number of connections
+        """
+        ids = [self.store.add("res.partner", name=str(idx)) for idx in range(50)]
+
+        async def read_all():
+            async with AsyncConnection(self.inner_script, concurrency=4) as conn:
+                return await asyncio.gather(
+                    *(conn.odoo_read("res.partner", [rec_id]) for rec_id in ids)
+                )
+
+        results = asyncio.run(read_all())
+        self.assertEqual(
+            [res[0]["name"] for res in results], [str(i) for i in range(50)]
+        )
+        self.assertLessEqual(self.server.connection_count, 5)
+
+    def test_concurrent_connect(self):
+        """
+        Test calls gathered before authentication share a single one
+        """
+        ids = [self.store.add("res.partner", name=str(idx)) for idx in range(50)]
+
+        async def read_all():
+            conn = AsyncConnection(self.inner_script, concurrency=4)
+            try:
+                return await asyncio.gather(
+                    *(conn.odoo_read("res.partner", [rec_id]) for rec_id in ids)
+                )
+            finally:
+                await conn.close()
+
+        self.assertEqual(len(asyncio.run(read_all())), 50)
+        # server_version, authenticate & the reads
+        self.assertEqual(self.server.request_count, 52)
+        self.assertLessEqual(self.server.connection_count, 4)
+
+    def test_crud(self):
+        """
+        Test create, search, write & delete
+        """
+
+        async def crud():
+            async with AsyncConnection(self.inner_script) as conn:
+                new_ids = await conn.odoo_create("res.partner", {"name": "Async"})
+                await conn.odoo_write("res.partner", new_ids, {"ref": "AS"})
+                found = await conn.odoo_search(
+                    "res.partner", [("ref", "=", "AS")], {"fields": ["name"]}
+                )
+                failed = await conn.odoo_write("res.partner", new_ids, {"name": "FAIL"})
+                deleted = await conn.odoo_delete("res.partner", new_ids)
+                return found, failed, deleted
+
+        found, failed, deleted = asyncio.run(crud())
+        self.assertEqual([rec["name"] for rec in found], ["Async"])
+        self.assertIsNone(failed)
+        self.assertTrue(deleted)
+        self.assertEqual(self.store.records("res.partner"), {})
+
+    def test_context(self):
+        """
+        Test the language context is only sent when none is given
+        """
+
+        async def search(kwargs):
+            async with AsyncConnection(self.inner_script) as conn:
+                await conn.execute_kw("res.partner", "search", [[]], kwargs)
+            return self.store.last_context
+
+        self.assertEqual(asyncio.run(search(None)), {"lang": "fr_FR"})
+        self.assertEqual(
+            asyncio.run(search({"context": {"lang": "en_US"}})), {"lang": "en_US"}
+        )
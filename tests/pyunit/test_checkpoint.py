@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test checkpoints of long running scripts
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+from os.path import sep
+import sys
+import tempfile
+import unittest
+
+from odootools.checkpoint import CheckpointStore
+
+from ..scripts.a_sample_script import SampleScript
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Checkpoint store Test
+    """
+
+    def setUp(self):
+        """Test Init"""
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        sys.argv = ["testing"]
+        self.inner_script = SampleScript()
+        self.inner_script.parse_config(
+            configfile="tests{asep}etc{asep}testScript.config".format(asep=sep)
+        )
+        self.inner_script.config.set("options", "output_directory", self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def test_processed_keys(self):
+        """
+        Test recording and filtering processed keys
+        """
+        with self.inner_script.get_checkpoint_store() as store:
+            self.assertEqual(store.mark_done(range(0, 3000, 2)), 1500)
+            self.assertEqual(store.mark_done(["REF-1", 0]), 2)
+            self.assertEqual(store.count(), 1501)
+            self.assertEqual(list(store.filter_new(range(10))), [1, 3, 5, 7, 9])
+            self.assertIn("REF-1", store)
+            store.set_watermark("last_id", 2998)
+
+        # same script & config: resumes
+        with self.inner_script.get_checkpoint_store() as store:
+            self.assertEqual(store.get_watermark("last_id"), 2998)
+            self.assertTrue(store.is_done(42))
+            store.set_watermark("last_id", None)
+            self.assertIsNone(store.get_watermark("last_id"))
+
+        # other config (values are not interpolated): independent
+        self.inner_script.config.read_string("[options]\nodoo_password = 100%pass\n")
+        with self.inner_script.get_checkpoint_store() as store:
+            self.assertEqual(store.count(), 0)
+            self.assertFalse(store.is_done(42))
+
+    def test_clear(self):
+        """
+        Test forgetting a namespace
+        """
+        filename = "{}{}checkpoints.sqlite".format(self.tmpdir.name, sep)
+        with CheckpointStore(filename, "one") as store:
+            store.mark_done([1, 2])
+        with CheckpointStore(filename, "two") as store:
+            store.mark_done([1])
+            store.clear()
+            self.assertEqual(store.count(), 0)
+        with CheckpointStore(filename, "one") as store:
+            self.assertEqual(store.count(), 2)
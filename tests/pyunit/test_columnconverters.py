@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test column-level converters
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import math
+import unittest
+
+from odootools import columnconverters, stringconverters
+
+
+class TestColumnConverters(unittest.TestCase):
+    """
+    Test column converters, against the cell by cell ones
+    """
+
+    def test_to_date_column(self):
+        """Test dates conversion"""
+        values = ["45000", 45000.75, "01/02/2026", "2026-02-01 00:00:00", "x", None]
+        memo = {}
+        dates, nulls = columnconverters.to_date_column(values, memo=memo)
+        for value, converted in zip(values[:4], dates):
+            expected = stringconverters.to_date(value)
+            if hasattr(expected, "date"):
+                expected = expected.date()
+            self.assertEqual(converted, expected)
+        self.assertEqual(dates[4:], [None, None])
+        self.assertEqual(nulls, [False] * 4 + [True] * 2)
+        self.assertEqual(len(memo), 6)
+
+    def test_to_float_int_columns(self):
+        """Test numbers conversion"""
+        values = ["1.5", "1.5", 3, "", "abc", None, "12"]
+        floats, nulls = columnconverters.to_float_column(values)
+        self.assertEqual(list(floats[:3]), [1.5, 1.5, 3.0])
+        self.assertTrue(all(math.isnan(val) for val in floats[3:6]))
+        self.assertEqual(nulls, [False] * 3 + [True] * 3 + [False])
+
+        ints, nulls = columnconverters.to_int_column(values)
+        self.assertEqual(
+            list(ints), [stringconverters.to_int(value) for value in values]
+        )
+        self.assertEqual(nulls, [False] * 3 + [True] * 3 + [False])
+
+    def test_out_of_range_values(self):
+        """Test ints & dates that cannot be represented are nulls"""
+        ints, nulls = columnconverters.to_int_column(
+            ["1e30", "12345678901234567890", 2]
+        )
+        self.assertEqual(list(ints), [-1, -1, 2])
+        self.assertEqual(nulls, [True, True, False])
+        dates, nulls = columnconverters.to_date_column([-1e6, 1e30])
+        self.assertEqual(dates, [None, None])
+        self.assertEqual(nulls, [True, True])
+
+    @unittest.skipUnless(columnconverters.NUMPY, "NumPy is not installed")
+    def test_numpy_columns(self):
+        """Test conversion of NumPy arrays"""
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        dates, nulls = columnconverters.to_date_column(
+            numpy.array([45000.5, numpy.nan])
+        )
+        self.assertEqual(dates[0], numpy.datetime64(stringconverters.to_date(45000.5)))
+        self.assertEqual(list(nulls), [False, True])
+        dates, nulls = columnconverters.to_date_column(
+            ["01/02/2026", "x"], as_numpy=True
+        )
+        self.assertEqual(dates[0], numpy.datetime64("2026-02-01"))
+        self.assertTrue(numpy.isnat(dates[1]))
+        ints, nulls = columnconverters.to_int_column(numpy.array([1.7, numpy.nan]))
+        self.assertEqual(list(ints), [1, -1])
+        self.assertEqual(list(nulls), [False, True])
+        ints, nulls = columnconverters.to_int_column(numpy.array([1e30, -1e30, 2.0]))
+        self.assertEqual(list(ints), [-1, -1, 2])
+        self.assertEqual(list(nulls), [True, True, False])
+        dates, nulls = columnconverters.to_date_column(numpy.array([-1e6, 1e30, 1.0]))
+        self.assertEqual(list(nulls), [True, True, False])
+        self.assertTrue(numpy.isnat(dates[0]))
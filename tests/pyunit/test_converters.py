@@ -11,10 +11,11 @@ Test Utility functions to convert data
 @license: LGPL
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 import unittest
 
-from odootools import stringconverters
+from odootools import converters, stringconverters
 
 
 class TestConverters(unittest.TestCase):
@@ -31,3 +32,35 @@ class TestConverters(unittest.TestCase):
         """Test Date formatting to String"""
         val = stringconverters.to_string(self.a_date)
         self.assertIsNotNone(val, "unable to translate date")
+
+    def test_register_to_string(self):
+        """Test conversion of registered types"""
+
+        class Money(float):
+            """a float subclass"""
+
+        self.assertEqual(
+            stringconverters.to_string(ValueError("x")), str(ValueError) + " -- x"
+        )
+        self.assertEqual(stringconverters.to_string(Money(2)), "2.0")
+        stringconverters.register_to_string(float, "{:.2f}".format)
+        stringconverters.register_to_string(Mapping, lambda value: "mapping")
+        try:
+            self.assertEqual(stringconverters.to_string(Money(2)), "2.00")
+            self.assertEqual(stringconverters.to_string(3), "3")
+            self.assertEqual(stringconverters.to_string({"a": 1}), "mapping")
+        finally:
+            stringconverters.unregister_to_string(float)
+            stringconverters.unregister_to_string(Mapping)
+        self.assertEqual(stringconverters.to_string(Money(2)), "2.0")
+
+    def test_date_to_odoo_string(self):
+        """Test Date formatting for Odoo"""
+        self.assertEqual(
+            converters.date_to_odoo_string(datetime(2026, 10, 18, 9, 5)),
+            "2026-10-18 09:05:00",
+        )
+        self.assertEqual(
+            converters.date_to_odoo_string(datetime(2026, 10, 18).date()), "2026-10-18"
+        )
+        self.assertEqual(converters.date_to_odoo_string(12), "12")
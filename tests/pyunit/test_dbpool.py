@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test the pool of database connections, with sqlite3 as DB-API driver
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+from os.path import sep
+import sqlite3
+import sys
+import threading
+import unittest
+
+from odootools import odooconnection
+from odootools.dbpool import DbConnectionPool, register_db_driver
+
+from ..scripts.a_sample_script import SampleScript
+
+
+def connect_sqlite(database, **_kwargs):
+    return sqlite3.connect(database, check_same_thread=False)
+
+
+class TestDbPool(unittest.TestCase):
+    """
+    Database connections pool Test
+    """
+
+    def setUp(self):
+        """Test Init"""
+        super().setUp()
+        register_db_driver("sqlite", connect_sqlite)
+        sys.argv = ["testing"]
+        self.inner_script = SampleScript()
+        self.inner_script.parse_config(
+            configfile="tests{asep}etc{asep}testScript.config".format(asep=sep)
+        )
+        self.inner_script.config.set("options", "db_name", ":memory:")
+        self.inner_script.config.set("options", "db_driver", "sqlite")
+        self.inner_script.config.set("options", "db_pool_max", "2")
+        self.inner_script.config.set("options", "db_pool_timeout", "0.2")
+        self.connection = odooconnection.Connection(self.inner_script)
+
+    def tearDown(self):
+        self.connection.close()
+        super().tearDown()
+
+    def test_reuse(self):
+        """
+        Test that connections are reused and bounded
+        """
+        for _idx in range(5):
+            with self.connection.db_session() as db_conn:
+                self.assertEqual(db_conn.execute("SELECT 1").fetchone(), (1,))
+        pool = self.connection.db_pool
+        self.assertEqual(pool.stats()["opened"], 1)
+        self.assertEqual(pool.stats()["reused"], 4)
+
+        first = self.connection.get_db_connection()
+        second = self.connection.get_db_connection()
+        self.assertIsNone(self.connection.get_db_connection())
+        threading.Timer(0.05, first.close).start()
+        third = self.connection.get_db_connection()
+        self.assertEqual(pool.stats()["opened"], 2)
+        second.close()
+        third.close()
+
+    def test_unclosed(self):
+        """
+        Test that garbage collected connections are given back
+        """
+        pool = DbConnectionPool(lambda: sqlite3.connect(":memory:"), max_size=1)
+        for _idx in range(3):
+            db_conn = pool.acquire()
+            del db_conn
+        self.assertEqual(pool.stats(), {"opened": 1, "reused": 2, "size": 1, "idle": 1})
+
+    def test_health_check(self):
+        """
+        Test that broken idle connections are replaced
+        """
+        pool = DbConnectionPool(
+            lambda: sqlite3.connect(":memory:"), min_size=1, check_interval=0
+        )
+        with pool.connection() as db_conn:
+            raw_connection = db_conn.raw_connection
+        # broken while idle
+        raw_connection.close()
+        with pool.connection() as db_conn:
+            self.assertEqual(db_conn.execute("SELECT 1").fetchone(), (1,))
+        self.assertEqual(pool.stats(), {"opened": 2, "reused": 1, "size": 1, "idle": 1})
@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test Odoo Connection against a local stand-in XML-RPC server
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import os
+from os.path import sep
+import sys
+import tempfile
+import unittest
+import xmlrpc.client as xmlrpclib
+
+from odootools import odooconnection
+from odootools.retry import CircuitOpenError
+
+from ..scripts.a_sample_script import SampleScript
+from ..scripts.fake_odoo_server import FakeOdooServer
+
+
+class TestOdooConn(unittest.TestCase):
+    """
+    Odoo Connection Test
+    """
+
+    def setUp(self):
+        """Test Init"""
+        super(TestOdooConn, self).setUp()
+        self.server = FakeOdooServer().start()
+        self.addCleanup(self.server.stop)
+        self.store = self.server.store
+
+        sys.argv = ["testing"]
+        self.inner_script = SampleScript()
+        self.inner_script.parse_config(
+            configfile="tests{asep}etc{asep}testScript.config".format(asep=sep)
+        )
+        self.inner_script.config.set("options", "odoo_port", str(self.server.port))
+        self.connection = odooconnection.Connection(self.inner_script)
+
+    def test_conn(self):
+        """
+        Test the Connection
+        """
+        uid, _models = self.connection.get_odoo_xmlrpc_connection()
+        self.assertEqual(uid, 2, "Failed to authenticate")
+
+    def test_keepalive(self):
+        """
+        Test calls reuse the same HTTP connection
+        """
+        self.connection.get_odoo_xmlrpc_connection()
+        for _idx in range(5):
+            self.connection.odoo_idsearch("res.partner", [])
+        self.assertEqual(self.server.connection_count, 1, "Connection not reused")
+
+    def test_keepalive_reconnect(self):
+        """
+        Test requests are re-sent when server closed the idle connection
+        """
+        self.connection.get_odoo_xmlrpc_connection()
+        self.server.drop_connections = True
+        for _idx in range(3):
+            self.assertEqual(self.connection.odoo_idsearch("res.partner", []), [])
+        self.assertEqual(self.server.connection_count, 3)
+
+    def test_search_create_or_write_many(self):
+        """
+        Test bulk upsert outcomes and round trips
+        """
+        existing = self.store.add("res.partner", name="Existing", ref="A1")
+        self.store.add("res.partner", name="Twin", ref="DUP")
+        self.store.add("res.partner", name="Twin", ref="DUP")
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        results = self.connection.odoo_search_create_or_write_many(
+            "res.partner",
+            [
+                ([("ref", "=", "A1")], {"name": "Updated"}),
+                ([("ref", "=", "B1")], {"name": "New one"}),
+                ([("ref", "=", "B2")], {"name": "New two"}),
+                ([("ref", "=", "DUP")], {"name": "Ambiguous"}),
+                ([("ref", "=", "B3")], {"name": "FAIL"}),
+                ([("ref", "=", "B1")], {"name": "New one again"}),
+            ],
+        )
+
+        statuses = [result.status for result in results]
+        self.assertEqual(
+            statuses,
+            [
+                odooconnection.UPSERT_UPDATED,
+                odooconnection.UPSERT_CREATED,
+                odooconnection.UPSERT_CREATED,
+                odooconnection.UPSERT_AMBIGUOUS,
+                odooconnection.UPSERT_FAILED,
+                odooconnection.UPSERT_UPDATED,
+            ],
+        )
+        self.assertEqual(results[0].id, existing)
+        self.assertEqual(results[5].id, results[1].id)
+        self.assertEqual(
+            self.store.records("res.partner")[results[1].id]["name"], "New one again"
+        )
+        self.assertEqual(
+            [call[1] for call in self.store.calls].count("search_read"),
+            1,
+            "Lookups should be resolved in one call",
+        )
+
+    def test_upsert_relational_criteria(self):
+        """
+        Test criteria that cannot be matched client-side are searched
+        """
+        self.store.field_types["res.partner"] = {
+            "country_id": "many2one",
+            "category_id": "many2many",
+        }
+        france = self.store.add("res.country", name="France")
+        by_name = self.store.add("res.partner", name="Name", country_id=france)
+        by_tag = self.store.add("res.partner", name="Tag", category_id=7)
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        results = self.connection.odoo_search_create_or_write_many(
+            "res.partner",
+            [
+                ([("country_id", "=", france)], {"ref": "ID"}),
+                ([("category_id", "=", 7)], {"ref": "TAG"}),
+            ],
+        )
+        self.assertEqual([result.id for result in results], [by_name, by_tag])
+        self.assertEqual(
+            [result.status for result in results], [odooconnection.UPSERT_UPDATED] * 2
+        )
+        # many2one given as an id is matched client-side, x2many searched
+        calls = [call[1] for call in self.store.calls]
+        self.assertEqual((calls.count("search_read"), calls.count("search")), (1, 1))
+        self.assertEqual(
+            odooconnection._simple_criteria_key(  # pylint: disable=protected-access
+                [("country_id", "=", "France")], {"country_id": "many2one"}
+            ),
+            None,
+        )
+
+    def test_parallel_execute(self):
+        """
+        Test map-style parallel calls through pooled proxies
+        """
+        ids = [self.store.add("res.partner", name=str(idx)) for idx in range(10)]
+        results = self.connection.parallel_execute(
+            "res.partner",
+            "read",
+            odooconnection.chunked(ids, 3),
+            workers=3,
+            args=(["name"],),
+        )
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            [rec["name"] for chunk in results for rec in chunk],
+            [str(idx) for idx in range(10)],
+        )
+
+    def test_iter_search(self):
+        """
+        Test records are yielded page by page
+        """
+        for idx in range(25):
+            self.store.add("res.partner", name=str(idx), is_company=idx % 2 == 0)
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        records = self.connection.iter_search(
+            "res.partner", [("is_company", "=", True)], ["name"], page_size=5
+        )
+        self.assertEqual(
+            [rec["name"] for rec in records], [str(idx) for idx in range(0, 25, 2)]
+        )
+        self.assertEqual(len(self.store.calls), 3)
+
+    def test_fields_projection(self):
+        """
+        Test explicit and configured fields projection
+        """
+        rec_id = self.store.add("res.partner", name="Proj", ref="P", street="Here")
+        self.inner_script.config.read_dict({"fields": {"res.partner": "name, ref"}})
+
+        found = self.connection.odoo_search("res.partner", [], {})
+        self.assertEqual(set(found[0]), {"id", "name", "ref"})
+        found = self.connection.odoo_read("res.partner", [rec_id], ["street"])
+        self.assertEqual(set(found[0]), {"id", "street"})
+        found = self.connection.odoo_read("res.partner", [rec_id], [])
+        self.assertIn("active", found[0])
+
+    def test_batch(self):
+        """
+        Test queued calls are merged
+        """
+        ids = [self.store.add("res.partner", name=str(idx)) for idx in range(4)]
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        with self.connection.batch(size=10) as batch:
+            writes = [batch.odoo_write("res.partner", i, {"ref": "W"}) for i in ids]
+            creates = [
+                batch.odoo_create("res.partner", {"name": name})
+                for name in ("C1", "FAIL", "C2")
+            ]
+            self.assertFalse(creates[0].done())
+
+        self.assertTrue(all(future.result() for future in writes))
+        self.assertRaises(Exception, creates[1].result)
+        records = self.store.records("res.partner")
+        self.assertEqual(records[creates[2].result()]["name"], "C2")
+        self.assertEqual(
+            [call[1] for call in self.store.calls],
+            ["write", "create", "create", "create", "create"],
+        )
+
+    def test_batch_order_and_errors(self):
+        """
+        Test writes to the same records keep their order, and errors of a
+        merged call do not hang futures
+        """
+        first, second = [self.store.add("res.partner", name=name) for name in "AB"]
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        with self.connection.batch(size=10) as batch:
+            for ref in ("V1", "V2", "V1"):
+                batch.odoo_write("res.partner", first, {"ref": ref})
+            batch.odoo_write("res.partner", second, {"ref": "V1"})
+        self.assertEqual(self.store.records("res.partner")[first]["ref"], "V1")
+        self.assertEqual(
+            [call[1] for call in self.store.calls], ["write", "write", "write"]
+        )
+
+        self.server.fail_next = 1
+        with self.connection.batch(size=10) as batch:
+            failed = [
+                batch.odoo_write("res.partner", i, {"ref": "X"})
+                for i in (first, second)
+            ]
+            unlinked = batch.odoo_execute("res.partner", "unlink", second, None)
+            unknown = batch.odoo_execute("res.partner", "frobnicate", first, None)
+        for future in failed:
+            self.assertIsInstance(future.exception(0), xmlrpclib.ProtocolError)
+        self.assertTrue(unlinked.result(0))
+        self.assertIsInstance(unknown.exception(0), xmlrpclib.Fault)
+        self.assertEqual(self.store.records("res.partner")[first]["ref"], "V1")
+
+    def test_jsonrpc(self):
+        """
+        Test the same methods over JSON-RPC
+        """
+        self.inner_script.config.set("options", "odoo_protocol", "jsonrpc")
+        rec_id = self.connection.odoo_create("res.partner", {"name": "Json"})[0]
+        self.assertTrue(self.connection.odoo_write("res.partner", rec_id, {"ref": "J"}))
+        self.assertIsNone(
+            self.connection.odoo_write("res.partner", rec_id, {"name": "FAIL"})
+        )
+        found = self.connection.odoo_search("res.partner", [("ref", "=", "J")], {})
+        self.assertEqual(found[0]["name"], "Json")
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_call_prefix(self):
+        """
+        Test credentials are resolved once, until config is reloaded
+        """
+        self.connection.get_odoo_xmlrpc_connection()
+        prefix = self.connection.get_call_prefix()
+        self.assertEqual(prefix, ("testdb", 2, "admin"))
+        self.inner_script.config.set("options", "odoo_password", "changed")
+        self.assertIs(self.connection.get_call_prefix(), prefix)
+
+        self.inner_script.config = None
+        self.inner_script.parse_config()
+        self.inner_script.config.set("options", "odoo_password", "changed")
+        self.assertEqual(self.connection.get_call_prefix()[2], "changed")
+
+    def test_read_cache(self):
+        """
+        Test cached reads and invalidation
+        """
+        country = self.store.add("res.country", code="FR")
+        self.connection.enable_cache("res.country", max_size=2)
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        for _idx in range(3):
+            self.assertEqual(
+                self.connection.odoo_idsearch("res.country", [("code", "=", "FR")]),
+                [country],
+            )
+            self.connection.odoo_read("res.country", [country], ["code"])
+        self.assertEqual(len(self.store.calls), 2)
+        self.assertEqual(
+            self.connection.cache_stats()["res.country"],
+            {"hits": 4, "misses": 2, "size": 2},
+        )
+
+        self.connection.odoo_write("res.country", country, {"code": "BE"})
+        found = self.connection.odoo_read("res.country", [country], ["code"])
+        self.assertEqual(found[0]["code"], "BE")
+
+        # a read made (e.g. by another thread) while the write is sent
+        send = self.connection._send  # pylint: disable=protected-access
+
+        def send_after_read(proxy, model_name, method_name, args, kwargs):
+            if method_name == "write":
+                self.connection.odoo_read("res.country", [country], ["code"])
+            return send(proxy, model_name, method_name, args, kwargs)
+
+        self.connection._send = send_after_read
+        self.connection.odoo_write("res.country", country, {"code": "DE"})
+        del self.connection._send
+        found = self.connection.odoo_read("res.country", [country], ["code"])
+        self.assertEqual(found[0]["code"], "DE")
+
+    def test_xmlid_index(self):
+        """
+        Test external ids resolution
+        """
+        for idx in range(5):
+            self.store.add(
+                "ir.model.data",
+                module="base",
+                name="country_{}".format(idx),
+                model="res.country",
+                res_id=100 + idx,
+            )
+        self.store.add(
+            "ir.model.data", module="other", name="x", model="res.partner", res_id=7
+        )
+        self.assertEqual(self.connection.load_xmlid_index(modules=["base"]), 5)
+        self.store.calls.clear()
+
+        self.assertEqual(self.connection.resolve_xmlid("base.country_3"), 103)
+        self.assertEqual(len(self.store.calls), 0)
+        self.assertEqual(
+            self.connection.resolve_many(
+                ["base.country_1", "other.x", "other.unknown"], "res.partner"
+            ),
+            {"base.country_1": None, "other.x": 7, "other.unknown": None},
+        )
+        self.assertEqual(len(self.store.calls), 1)
+        self.assertEqual(
+            self.connection.resolve_many(["other.unknown", "no_module"]),
+            {"other.unknown": None, "no_module": None},
+        )
+        self.assertEqual(len(self.store.calls), 1)
+
+        # ids of a failed search are searched again
+        self.server.fail_next = 1
+        self.server.fail_status = 500
+        self.assertIsNone(self.connection.resolve_xmlid("base.country_4_bis"))
+        self.store.add(
+            "ir.model.data",
+            module="base",
+            name="country_4_bis",
+            model="res.country",
+            res_id=105,
+        )
+        self.assertEqual(self.connection.resolve_xmlid("base.country_4_bis"), 105)
+
+        new_id = self.connection.odoo_create(
+            "res.partner", {"name": "With xmlid"}, xmlid="other.new"
+        )[0]
+        self.assertEqual(self.connection.resolve_xmlid("other.new"), new_id)
+
+    def test_delete_chunked(self):
+        """
+        Test chunked deletion goes on after failures
+        """
+        ids = [self.store.add("res.partner", name=str(idx)) for idx in range(10)]
+        self.store.records("res.partner")[ids[4]]["protected"] = True
+
+        failed = self.connection.odoo_delete_chunked(
+            "res.partner", ids, chunk_size=3, workers=2
+        )
+        self.assertEqual(failed, ids[3:6])
+        self.assertEqual(sorted(self.store.records("res.partner")), ids[3:6])
+        self.assertFalse(self.connection.odoo_delete("res.partner", ids, chunk_size=2))
+
+    def test_retry(self):
+        """
+        Test transient errors are retried, and circuit breaker
+        """
+        self.inner_script.config.read_dict(
+            {"retry": {"backoff": "0", "breaker_threshold": "4"}}
+        )
+        rec_id = self.store.add("res.partner", name="Retry")
+        self.connection.get_odoo_xmlrpc_connection()
+
+        self.server.fail_next = 2
+        self.assertEqual(
+            self.connection.odoo_read("res.partner", [rec_id], ["name"])[0]["name"],
+            "Retry",
+        )
+        # transaction rolled back by the server: retried, even for a write
+        self.store.serialization_failures = 2
+        self.assertTrue(self.connection.odoo_write("res.partner", rec_id, {"ref": "S"}))
+        self.server.fail_next = 1
+        self.assertRaises(
+            xmlrpclib.ProtocolError,
+            self.connection.odoo_write,
+            "res.partner",
+            rec_id,
+            {"ref": "R"},
+        )
+
+        # breaker opens after 4 consecutive failures, during retries
+        self.server.fail_next = 10
+        self.assertRaises(
+            CircuitOpenError, self.connection.odoo_read, "res.partner", [rec_id]
+        )
+        request_count = self.server.request_count
+        self.assertRaises(
+            CircuitOpenError, self.connection.odoo_read, "res.partner", [rec_id]
+        )
+        self.assertEqual(self.server.request_count, request_count)
+
+        # a trial call failing with a non transient error lets the next one try
+        self.connection.circuit_breaker.cooldown = 0
+        self.server.fail_next = 1
+        self.server.fail_status = 500
+        self.assertRaises(
+            xmlrpclib.ProtocolError, self.connection.odoo_read, "res.partner", [rec_id]
+        )
+        self.assertEqual(
+            self.connection.odoo_read("res.partner", [rec_id], ["ref"])[0]["ref"], "S"
+        )
+
+    def test_call_statistics(self):
+        """
+        Test calls are recorded per model & method
+        """
+        rec_id = self.store.add("res.partner", name="Stats")
+        for _idx in range(3):
+            self.connection.odoo_read("res.partner", [rec_id])
+        self.connection.odoo_write("res.partner", rec_id, {"name": "FAIL"})
+
+        rows = {
+            (row["model"], row["method"]): row
+            for row in self.connection.instrumentation.rows()
+        }
+        self.assertEqual(rows[("res.partner", "read")]["calls"], 3)
+        self.assertGreater(rows[("res.partner", "read")]["response_bytes"], 0)
+        self.assertEqual(rows[("res.partner", "write")]["faults"], 1)
+        self.assertIn("res.partner", self.connection.instrumentation.format_summary())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "stats.csv")
+            self.connection.instrumentation.export(filename)
+            with open(filename) as afile:
+                self.assertEqual(len(afile.readlines()), 3)
+
+    def test_read_group(self):
+        """
+        Test paged aggregation
+        """
+        for idx in range(30):
+            self.store.add(
+                "account.move.line", account_id=idx % 5, balance=idx, journal_id=1
+            )
+        self.connection.get_odoo_xmlrpc_connection()
+        self.store.calls.clear()
+
+        rows = self.connection.odoo_read_group(
+            "account.move.line", [], ["balance:sum"], ["account_id"], page_size=2
+        )
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1], {"account_id": 1, "balance": 81, "__count": 6})
+        self.assertEqual(len(self.store.calls), 3)
+        rows = self.connection.odoo_read_group(
+            "account.move.line",
+            [("account_id", "<", 2)],
+            ["balance"],
+            ["journal_id", "account_id"],
+            lazy=True,
+        )
+        self.assertEqual(rows, [{"journal_id": 1, "balance": 156, "__count": 12}])
+
+    def test_count_and_upsert(self):
+        """
+        Test that upsert decides create/write/ambiguous on ids only
+        """
+        self.store.add("res.partner", name="Dup", ref="D")
+        self.store.add("res.partner", name="Dup", ref="D")
+        self.store.add("res.partner", name="Dup", ref="D")
+        self.assertEqual(self.connection.odoo_count("res.partner", []), 3)
+        self.assertEqual(
+            self.connection.odoo_idsearch("res.partner", [("ref", "=", "D")], limit=2),
+            [1, 2],
+        )
+        self.store.calls.clear()
+
+        self.assertIsNone(
+            self.connection.odoo_search_create_or_write(
+                "res.partner", [("ref", "=", "D")], {"name": "X"}
+            )
+        )
+        new_id = self.connection.odoo_search_create_or_write(
+            "res.partner", [("ref", "=", "N")], {"name": "New", "ref": "N"}
+        )
+        self.assertEqual(
+            self.connection.odoo_search_create_or_write(
+                "res.partner", [("ref", "=", "N")], {"name": "Newer"}
+            ),
+            new_id,
+        )
+        self.assertEqual(self.store.records("res.partner")[new_id]["name"], "Newer")
+        self.assertEqual(
+            [call[1] for call in self.store.calls],
+            ["search", "search", "create", "search", "write"],
+        )
+
+    def test_or_domains(self):
+        """
+        Test domains combination
+        """
+        self.assertEqual(
+            odooconnection.or_domains(
+                [[("a", "=", 1), ("b", "=", 2)], [("c", "=", 3)]]
+            ),
+            ["|", "&", ("a", "=", 1), ("b", "=", 2), ("c", "=", 3)],
+        )
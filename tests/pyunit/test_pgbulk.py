@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+Test bulk PostgreSQL helpers that do not need a database
+
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import unittest
+
+from datetime import date
+
+from odootools.pgbulk import format_copy_value, parse_copy_line
+
+
+class TestPgBulk(unittest.TestCase):
+    """
+    Bulk PostgreSQL helpers Test
+    """
+
+    def test_parse_copy_line(self):
+        """
+        Test parsing of COPY text format
+        """
+        self.assertEqual(
+            parse_copy_line("12\tOne\\tTwo\\nThree\t\\N\tC:\\\\tmp\n"),
+            ("12", "One\tTwo\nThree", None, "C:\\tmp"),
+        )
+        self.assertEqual(parse_copy_line("\t\n"), ("", ""))
+
+    def test_format_copy_value(self):
+        """
+        Test formatting of values for COPY FROM STDIN
+        """
+        values = (None, True, date(2026, 10, 1), 3.5, "a\\b\tc\nd")
+        line = "\t".join(format_copy_value(value) for value in values) + "\n"
+        self.assertEqual(
+            parse_copy_line(line), (None, "t", "2026-10-01", "3.5", "a\\b\tc\nd")
+        )
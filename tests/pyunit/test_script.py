@@ -15,6 +15,8 @@ from os.path import sep
 import sys
 import unittest
 
+from odootools.odooscript import split_id_ranges
+
 from ..scripts.a_sample_script import SampleScript
 
 
@@ -71,3 +73,19 @@ class TestOdooScript(unittest.TestCase):
             self.inner_script.get_config_value("nonexistent", datatype="bool"),
             "Unable to parse config",
         )
+
+    def test_split_id_ranges(self):
+        """
+        Test splitting of ids for parallel runs
+        """
+        self.assertEqual(
+            split_id_ranges([1, 2, 5, 8, 9, 12, 40], 3), [(1, 5), (8, 12), (40, 40)]
+        )
+        self.assertEqual(split_id_ranges([], 3), [])
+
+    def test_parallel_needs_run_chunk(self):
+        """
+        Test scripts without run_chunk fail before starting workers
+        """
+        with self.assertRaises(TypeError):
+            self.inner_script.run_in_odoo_parallel("res.partner")
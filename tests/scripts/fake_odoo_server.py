@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+
+"""
+Created on october 2026
+
+A local stand-in for an Odoo XML-RPC server, used for unit testing
+odooconnection without a running Odoo instance
+
+@author: C. Guychard
+@copyright: ©2026 Article714
+@license: LGPL
+"""
+
+import json
+import operator
+import threading
+import xmlrpc.client as xmlrpclib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# -------------------------------------------------------------------------------------
+# CONSTANTS
+
+SERVER_VERSION = "16.0-20230101"
+
+# fields_get types of stored values, by python type
+VALUE_FIELD_TYPES = ((bool, "boolean"), (int, "integer"), (float, "float"))
+
+LEAF_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "in": lambda value, arg: value in arg,
+    "not in": lambda value, arg: value not in arg,
+    "ilike": lambda value, arg: str(arg).lower() in str(value or "").lower(),
+}
+
+
+# -------------------------------------------------------------------------------------
+def _leaf_value(value):
+    """
+    many2one values are stored as ids, compare on them
+    """
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return value[0]
+    return value
+
+
+# -------------------------------------------------------------------------------------
+def eval_domain(domain, record):
+    """
+    Evaluates an Odoo domain (polish notation, implicit AND) against a record
+    """
+    stack = []
+    for token in reversed(list(domain) or []):
+        if token == "!":
+            stack.append(not stack.pop())
+        elif token in ("&", "|"):
+            first, second = stack.pop(), stack.pop()
+            stack.append(first and second if token == "&" else first or second)
+        else:
+            field, oper, arg = token
+            if oper == "ilike":
+                value = record.get(field)
+            else:
+                value = _leaf_value(record.get(field, False))
+            stack.append(LEAF_OPERATORS[oper](value, arg))
+    return all(stack)
+
+
+# -------------------------------------------------------------------------------------
+class FakeOdooStore:
+    """
+    In-memory model storage
+    """
+
+    def __init__(self):
+        self.models = {}
+        self.next_id = 1
+        self.calls = []
+        self.last_context = None
+        # model -> field -> type, when not guessed from stored values
+        self.field_types = {}
+        # next writes/creates failing as concurrent updates
+        self.serialization_failures = 0
+        self.lock = threading.Lock()
+
+    def records(self, model_name):
+        """
+        records of a model, keyed by id
+        """
+        return self.models.setdefault(model_name, {})
+
+    def add(self, model_name, **values):
+        """
+        direct insertion helper, returns new id
+        """
+        with self.lock:
+            new_id = self.next_id
+            self.next_id += 1
+        values["id"] = new_id
+        values.setdefault("active", True)
+        self.records(model_name)[new_id] = values
+        return new_id
+
+    def search(self, model_name, domain, offset=0, limit=None, order=None):
+        """
+        ids of matching records
+        """
+        found = [
+            rec_id
+            for rec_id, rec in sorted(self.records(model_name).items())
+            if eval_domain(domain, rec)
+        ]
+        if order and order.strip().lower().endswith("desc"):
+            found.reverse()
+        found = found[offset:]
+        if limit:
+            found = found[:limit]
+        return found
+
+    def read(self, model_name, ids, fields=None):
+        """
+        reads records, projecting them on fields if given
+        """
+        result = []
+        for rec_id in ids:
+            rec = self.records(model_name)[rec_id]
+            if fields:
+                result.append(
+                    {key: rec.get(key, False) for key in set(fields) | {"id"}}
+                )
+            else:
+                result.append(dict(rec))
+        return result
+
+    def execute_kw(self, model_name, method, args, kwargs):
+        # pylint: disable=too-many-return-statements
+        """
+        dispatches an ORM call
+        """
+        self.calls.append((model_name, method))
+        kwargs = dict(kwargs or {})
+        self.last_context = kwargs.pop("context", None)
+        if method in ("read", "write", "unlink") and isinstance(args[0], int):
+            args = [[args[0]]] + list(args[1:])
+        if method in ("create", "write") and self.serialization_failures:
+            self.serialization_failures -= 1
+            raise xmlrpclib.Fault(
+                1, "TransactionRollbackError\ncould not serialize access\n"
+            )
+        if method == "search":
+            return self.search(model_name, args[0], **kwargs)
+        if method == "search_read":
+            fields = kwargs.pop("fields", None)
+            return self.read(
+                model_name, self.search(model_name, args[0], **kwargs), fields
+            )
+        if method == "search_count":
+            return len(self.search(model_name, args[0]))
+        if method == "read":
+            fields = args[1] if len(args) > 1 else kwargs.get("fields")
+            return self.read(model_name, args[0], fields)
+        if method == "create":
+            vals = args[0]
+            if isinstance(vals, list):
+                for val in vals:
+                    self._check_values(val)
+                return [self.add(model_name, **dict(val)) for val in vals]
+            self._check_values(vals)
+            return self.add(model_name, **dict(vals))
+        if method == "write":
+            self._check_values(args[1])
+            for rec_id in args[0]:
+                self.records(model_name)[rec_id].update(args[1])
+            return True
+        if method == "unlink":
+            if any(
+                self.records(model_name).get(i, {}).get("protected") for i in args[0]
+            ):
+                raise xmlrpclib.Fault(1, "UserError\nProtected record\n")
+            for rec_id in args[0]:
+                self.records(model_name).pop(rec_id, None)
+            return True
+        if method == "read_group":
+            return self.read_group(model_name, *args, **kwargs)
+        if method == "fields_get":
+            return self.fields_get(model_name)
+        raise xmlrpclib.Fault(2, "Unknown method {}".format(method))
+
+    def read_group(  # pylint: disable=too-many-arguments
+        self, model_name, domain, fields, groupby, offset=0, limit=None, **kwargs
+    ):
+        """
+        groups records on groupby fields, summing other fields
+        """
+        lazy = kwargs.get("lazy", True)
+        if lazy:
+            groupby = groupby[:1]
+        groups = {}
+        for rec in self.read(model_name, self.search(model_name, domain)):
+            key = tuple(rec.get(field, False) for field in groupby)
+            group = groups.setdefault(key, {"__count": 0})
+            group["__count"] += 1
+            for spec in fields:
+                field = spec.split(":")[0]
+                if field not in groupby:
+                    group[field] = group.get(field, 0) + rec.get(field, 0)
+        result = []
+        for key in sorted(groups):
+            group = dict(zip(groupby, key), **groups[key])
+            group["__domain"] = [(field, "=", val) for field, val in zip(groupby, key)]
+            if lazy:
+                group["{}_count".format(groupby[0])] = group.pop("__count")
+            result.append(group)
+        result = result[offset:]
+        return result[:limit] if limit else result
+
+    def fields_get(self, model_name):
+        """
+        types of stored fields, guessed from values if not declared
+        """
+        fields = {}
+        for rec in self.records(model_name).values():
+            for field, value in rec.items():
+                field_type = "char"
+                for value_type, name in VALUE_FIELD_TYPES:
+                    if isinstance(value, value_type):
+                        field_type = name
+                        break
+                fields[field] = {"type": field_type}
+        for field, field_type in self.field_types.get(model_name, {}).items():
+            fields[field] = {"type": field_type}
+        return fields
+
+    @staticmethod
+    def _check_values(values):
+        """
+        lets tests trigger server side errors
+        """
+        if values.get("name") == "FAIL":
+            raise xmlrpclib.Fault(1, "ValidationError\nInvalid name\n")
+
+
+# -------------------------------------------------------------------------------------
+class FakeOdooHandler(BaseHTTPRequestHandler):
+    """
+    Handles xmlrpc requests like Odoo does
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        answers a POST request
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.request_count += 1
+        if self.server.fail_next:
+            self.server.fail_next -= 1
+            self.rfile.read(length)
+            self.send_response(self.server.fail_status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/jsonrpc":
+            content_type, body = self._jsonrpc(json.loads(self.rfile.read(length)))
+        else:
+            content_type, body = self._xmlrpc(*xmlrpclib.loads(self.rfile.read(length)))
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body.encode())))
+        self.end_headers()
+        self.wfile.write(body.encode())
+        if self.server.drop_connections:
+            # silently drops the connection, like a server closing idle sockets
+            self.close_connection = True
+
+    def _xmlrpc(self, params, method):
+        try:
+            result = self.server.dispatch(self.path, method, params)
+            body = xmlrpclib.dumps((result,), methodresponse=True, allow_none=True)
+        except xmlrpclib.Fault as err:
+            body = xmlrpclib.dumps(err, allow_none=True)
+        return "text/xml", body
+
+    def _jsonrpc(self, request):
+        params = request["params"]
+        answer = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            answer["result"] = self.server.dispatch(
+                "/" + params["service"], params["method"], params["args"]
+            )
+        except xmlrpclib.Fault as err:
+            answer["error"] = {
+                "code": 200,
+                "message": "Odoo Server Error",
+                "data": {"debug": err.faultString, "message": err.faultString},
+            }
+        return "application/json", json.dumps(answer)
+
+
+# -------------------------------------------------------------------------------------
+class FakeOdooServer(ThreadingHTTPServer):
+    """
+    Threaded server running in background
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeOdooHandler)
+        self.store = FakeOdooStore()
+        self.request_count = 0
+        self.connection_count = 0
+        self.drop_connections = False
+        self.fail_next = 0
+        self.fail_status = 502
+        self.thread = None
+
+    @property
+    def port(self):
+        """
+        listening port
+        """
+        return self.server_address[1]
+
+    def process_request(self, request, client_address):
+        self.connection_count += 1
+        super().process_request(request, client_address)
+
+    def dispatch(self, path, method, params):
+        """
+        routes a call to the right service
+        """
+        if path.endswith("/db"):
+            if method == "server_version":
+                return SERVER_VERSION
+        elif path.endswith("/common"):
+            if method == "version":
+                return {"server_version": SERVER_VERSION}
+            if method == "authenticate":
+                return 2 if params[2] == "admin" else False
+        elif path.endswith("/object") and method == "execute_kw":
+            kwargs = params[6] if len(params) > 6 else {}
+            return self.store.execute_kw(params[3], params[4], params[5], kwargs)
+        raise xmlrpclib.Fault(1, "Unknown service method {}".format(method))
+
+    def start(self):
+        """
+        serve in a background thread
+        """
+        self.thread = threading.Thread(
+            target=self.serve_forever, args=(0.05,), daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        shutdown server
+        """
+        self.shutdown()
+        self.server_close()